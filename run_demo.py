@@ -7,19 +7,13 @@ Small bootstrap demo to prove the project skeleton + I/O work.
 - Saves a simple 2D plot of all paths to demo_paths.png
 """
 
-import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from deconflict import io, visualize  # type: ignore
-from deconflict.models import PrimaryMission, SimulatedFlight  # type: ignore
-from src.deconflict.traject import interpolate_from_waypoints
-from src.deconflict.visualize import animate_2d, plot_interactive_3d, plot_static_2d
-
-ROOT_DIR = Path(__file__).resolve().parent
-SRC_DIR = ROOT_DIR / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
+from deconflict import io, visualize
+from deconflict.models import PrimaryMission, SimulatedFlight
+from deconflict.traject import interpolate_from_waypoints
+from deconflict.visualize import animate_2d, plot_interactive_3d, plot_static_2d
 
 
 def main() -> None:
@@ -4,9 +4,10 @@ Simple demo video builder for the UAV deconfliction project.
 
 - Uses the existing animation.mp4 as the main visual.
 - If docs/voiceover.wav exists, it will be muxed in as the audio track.
+- Without a voiceover, an H.264 animation is stream-copied (no re-encode).
 - Output: deliverables/uav_deconflict_demo.mp4
 
-Requires: ffmpeg installed and on PATH.
+Requires: ffmpeg (and ffprobe) installed and on PATH.
 """
 
 from __future__ import annotations
@@ -27,6 +28,22 @@ def run_ffmpeg(cmd: str) -> None:
         sys.exit(1)
 
 
+def probe_video_codec(path: Path) -> str | None:
+    """Return the codec name of the first video stream, or None if unknown."""
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=codec_name",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        str(path),
+    ]
+    try:
+        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
 def main() -> None:
     # Project root = two levels up from this script: scripts/make_demo_video.py
     root = Path(__file__).resolve().parents[1]
@@ -39,7 +56,7 @@ def main() -> None:
         print(f"[ERROR] Animation file not found: {anim_mp4}")
         print("Run the CLI with --animate first, e.g.:")
         print(
-            "  python src/cli.py "
+            "  python -m deconflict.cli "
             "--primary data/sample_primary_mission.json "
             "--sim data/sample_simulated_flights.json "
             "--buffer 50 --dt 1.0 --out report.json --animate"
@@ -62,12 +79,21 @@ def main() -> None:
             f'"{out_video}"'
         )
         print("[INFO] Using animation.mp4 + docs/voiceover.wav")
+    elif probe_video_codec(anim_mp4) == "h264":
+        # No voiceover and already H.264: copy the stream, no re-encode
+        cmd = (
+            f'ffmpeg -y '
+            f'-i "{anim_mp4}" '
+            f'-c:v copy -an '
+            f'"{out_video}"'
+        )
+        print("[INFO] No docs/voiceover.wav found. Copying H.264 animation.")
     else:
-        # No voiceover yet: just re-encode animation.mp4 into deliverables
+        # No voiceover and not H.264: re-encode animation.mp4 into deliverables
         cmd = (
             f'ffmpeg -y '
             f'-i "{anim_mp4}" '
-            f'-c:v libx264 -pix_fmt yuv420p -an '
+            f'-c:v libx264 -preset veryfast -crf 23 -pix_fmt yuv420p -an '
             f'"{out_video}"'
         )
         print("[INFO] No docs/voiceover.wav found. Creating silent demo video.")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+Pre-build the compiled deconflict kernels.
+
+- Default: import deconflict._kernels and call each kernel once, so the
+  Numba on-disk cache (`@njit(cache=True)`) is populated, e.g. during
+  install or in CI. Later CLI runs then load the cache instead of compiling.
+- --aot: additionally compile the kernels ahead of time with numba.pycc
+  into src/deconflict/_kernels_aot.*.so, which _kernels prefers when present
+  and which needs no JIT at runtime.
+
+Requires: numba.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+
+def build_aot() -> None:
+    """Compile the kernels listed in _kernels.AOT_SIGNATURES with pycc."""
+    from numba.pycc import CC
+
+    from deconflict import _kernels
+
+    pkg_dir = Path(_kernels.__file__).resolve().parent
+    cc = CC("_kernels_aot")
+    cc.output_dir = str(pkg_dir)
+    cc.export("min_dist2_idx", _kernels.AOT_SIGNATURES["min_dist2_idx"])(
+        _kernels._min_dist2_idx_loop
+    )
+    cc.compile()
+    print(f"[warm_numba] AOT kernels written to {pkg_dir}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--aot",
+        action="store_true",
+        help="Also build the ahead-of-time compiled kernel extension",
+    )
+    args = parser.parse_args()
+
+    from deconflict import _compat
+
+    if not _compat.HAS_NUMBA:
+        print("[warm_numba] numba is not installed; nothing to compile.")
+        return
+
+    if args.aot:
+        build_aot()
+
+    from deconflict import _kernels
+
+    _kernels.warmup()
+    print("[warm_numba] Kernel cache is warm.")
+
+
+if __name__ == "__main__":
+    main()
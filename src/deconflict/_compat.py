@@ -0,0 +1,14 @@
+# src/deconflict/_compat.py
+"""
+Optional-dependency flags.
+
+Numba is used for the compiled kernels in _kernels.py when available;
+every kernel has a pure-NumPy fallback so the package works without it.
+"""
+
+try:
+    import numba  # noqa: F401
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMBA = False
+else:
+    HAS_NUMBA = True
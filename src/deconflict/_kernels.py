@@ -0,0 +1,199 @@
+# src/deconflict/_kernels.py
+"""
+Low-level numeric kernels shared by spatial / temporal checks.
+
+Each kernel is resolved once at import time, in order of preference:
+
+1. the ahead-of-time compiled extension `_kernels_aot` (built by
+   `python scripts/warm_numba.py --aot`), which needs no JIT at runtime;
+2. Numba `@njit(cache=True)`, compiled on first call and cached on disk
+   so later processes skip compilation;
+3. a pure-NumPy fallback.
+
+conflict_kernel uses prange, which numba.pycc cannot compile, so it
+skips step 1.
+
+All versions take 1D float ndarrays (not lists) of the trajectory
+position dtype (float64); squared distances are compared directly and
+only the final minimum is square-rooted.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from ._compat import HAS_NUMBA
+from .models import POSITION_DTYPE
+
+if HAS_NUMBA:
+    from numba import prange
+else:
+    prange = range
+
+# Explicit signatures for the AOT build (see scripts/warm_numba.py)
+AOT_SIGNATURES = {
+    "min_dist2_idx": "Tuple((f8, i8))(f8[:], f8[:], f8[:], f8[:])",
+}
+
+
+def _min_dist2_idx_loop(xA, yA, xB, yB):
+    best = np.inf
+    best_i = 0
+    for i in range(xA.shape[0]):
+        dx = xA[i] - xB[i]
+        dy = yA[i] - yB[i]
+        d2 = dx * dx + dy * dy
+        if d2 < best:
+            best = d2
+            best_i = i
+    return best, best_i
+
+
+def _min_dist2_idx_numpy(xA, yA, xB, yB):
+    dx = xA - xB
+    dy = yA - yB
+    d2 = dx * dx + dy * dy
+    i = int(np.argmin(d2))
+    return d2[i], i
+
+
+def _make_conflict_d2_loop(ndim, parallel):
+    """
+    Conflict loop specialized for 2 (x, y) or 3 (x, y, z) dimensions.
+
+    Each (ndim, parallel) variant gets its own closure: Numba's on-disk
+    cache keys on bytecode and closure contents, not on the njit flags, so
+    sharing one function between the parallel and serial builds would
+    load whichever variant was cached first for both.
+    """
+    loop_range = prange if parallel else range
+
+    def _conflict_d2_loop(tp, pp, ts, ps, t_grid, buf2):
+        n = t_grid.shape[0]
+        d2 = np.empty(n, dtype=np.float64)
+        for i in loop_range(n):
+            t = t_grid[i]
+            jp = min(max(np.searchsorted(tp, t, side="right") - 1, 0), tp.shape[0] - 2)
+            js = min(max(np.searchsorted(ts, t, side="right") - 1, 0), ts.shape[0] - 2)
+            # Weights and distances are float64 whatever the storage dtype
+            wp = min(max((t - tp[jp]) / (tp[jp + 1] - tp[jp]), 0.0), 1.0)
+            ws = min(max((t - ts[js]) / (ts[js + 1] - ts[js]), 0.0), 1.0)
+            acc = 0.0
+            # ndim is a compile-time constant, so this loop is unrolled
+            for k in range(ndim):
+                a = pp[k, jp] + wp * (pp[k, jp + 1] - pp[k, jp])
+                b = ps[k, js] + ws * (ps[k, js + 1] - ps[k, js])
+                acc += (b - a) * (b - a)
+            d2[i] = acc
+        idx = np.flatnonzero(d2 < buf2)
+        return idx, d2[idx]
+
+    return _conflict_d2_loop
+
+
+def _make_conflict_d2_numpy(ndim):
+    def _conflict_d2_numpy(tp, pp, ts, ps, t_grid, buf2):
+        diff = np.empty((t_grid.shape[0], ndim), dtype=np.float64)
+        for k in range(ndim):
+            diff[:, k] = np.interp(t_grid, ts, ps[k]) - np.interp(t_grid, tp, pp[k])
+        d2 = np.einsum("ij,ij->i", diff, diff)
+        idx = np.flatnonzero(d2 < buf2)
+        return idx, d2[idx]
+
+    return _conflict_d2_numpy
+
+
+try:
+    from ._kernels_aot import min_dist2_idx as _min_dist2_idx
+except ImportError:
+    if HAS_NUMBA:
+        from numba import njit
+
+        _min_dist2_idx = njit(cache=True, fastmath=True, boundscheck=False)(
+            _min_dist2_idx_loop
+        )
+    else:
+        _min_dist2_idx = _min_dist2_idx_numpy
+
+# Conflict kernels, specialized per (use_3d, parallel) and picked once per
+# call. parallel=True kernels cannot be built by numba.pycc, so these are
+# JIT only. All variants release the GIL; the serial ones are meant for
+# callers that already spread flights over threads.
+def _build_conflict_kernels():
+    kernels = {}
+    for use_3d in (False, True):
+        ndim = 3 if use_3d else 2
+        if HAS_NUMBA:
+            from numba import njit
+
+            kernels[use_3d, True] = njit(
+                parallel=True, fastmath=True, cache=True, nogil=True)(
+                _make_conflict_d2_loop(ndim, parallel=True))
+            kernels[use_3d, False] = njit(
+                fastmath=True, cache=True, nogil=True)(
+                _make_conflict_d2_loop(ndim, parallel=False))
+        else:
+            kernels[use_3d, True] = kernels[use_3d, False] = (
+                _make_conflict_d2_numpy(ndim))
+    return kernels
+
+
+_CONFLICT_KERNELS = _build_conflict_kernels()
+
+
+def min_dist_idx(
+    xA: np.ndarray, yA: np.ndarray, xB: np.ndarray, yB: np.ndarray
+) -> Tuple[float, int]:
+    """
+    Minimum pointwise 2D distance between A and B and the index where it
+    occurs, computed in a single pass over squared distances (one sqrt).
+    """
+    if xA.shape[0] == 0:
+        raise ValueError("min_dist_idx needs at least one sample")
+    d2, idx = _min_dist2_idx(xA, yA, xB, yB)
+    return float(np.sqrt(d2)), int(idx)
+
+
+def conflict_kernel(
+    tp: np.ndarray,
+    pp: np.ndarray,
+    ts: np.ndarray,
+    ps: np.ndarray,
+    t_grid: np.ndarray,
+    buf2: float,
+    use_3d: bool,
+    parallel: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Interpolate the primary (tp, pp) and one simulated flight (ts, ps) at
+    every time of t_grid (pp / ps are (3, N) SoA positions, see
+    Trajectory.positions_xyz) and return the grid indices where their squared
+    2D (3D if use_3d) distance is below buf2, with those squared distances.
+
+    Fused sample -> diff -> threshold pass; with Numba the grid is split
+    across threads (prange) and nothing is materialized per sample. Pass
+    parallel=False when calling from several Python threads at once: the
+    serial variant still runs without the GIL, while concurrent parallel
+    regions oversubscribe the cores (and are unsafe under the workqueue
+    layer, Numba's fallback when neither TBB nor OpenMP is available).
+    """
+    kernel = _CONFLICT_KERNELS[bool(use_3d), bool(parallel)]
+    return kernel(tp, pp, ts, ps, t_grid, float(buf2))
+
+
+def warmup() -> None:
+    """
+    Call every kernel once on tiny inputs so JIT compilation (and the
+    on-disk Numba cache) happens up front rather than on first real use.
+    """
+    a = np.zeros(2, dtype=POSITION_DTYPE)
+    min_dist_idx(a, a, a, a)
+    t = np.array([0.0, 1.0])
+    p = np.zeros((3, 2), dtype=POSITION_DTYPE)
+    # Every (use_3d, parallel) variant is its own closure and so gets its
+    # own cache entry (see _make_conflict_d2_loop)
+    for use_3d in (False, True):
+        for parallel in (False, True):
+            conflict_kernel(t, p, t, p, t, 1.0, use_3d, parallel)
@@ -4,24 +4,91 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
+from scipy.spatial import cKDTree
+
 from .io import load_primary, load_simulated_flights
 from .models import PrimaryMission, SimulatedFlight
 from .temporal import check_spatiotemporal_conflicts
 from .traject import Trajectory, interpolate_from_waypoints
 
 
+def naive_conflict_scores(
+    distances_m: np.ndarray, threshold_m: float = 50.0
+) -> np.ndarray:
+    """
+    Vectorized risk score: map separation distances to [0,1], with 1 at
+    zero separation falling linearly to 0 at threshold_m.
+
+    Branch-free, so it can be applied directly to a whole distance array
+    (e.g. the per-sample distances of a conflict check).
+    """
+    if threshold_m <= 0.0:
+        raise ValueError("threshold_m must be positive")
+    d = np.asarray(distances_m, dtype=float)
+    return np.clip((threshold_m - d) / threshold_m, 0.0, 1.0)
+
+
 def naive_conflict_score(distance_m: float, threshold_m: float = 50.0) -> float:
     """
     Simple helper to turn a separation distance into a [0,1] "risk" score.
 
     Currently not used in the main pipeline, but kept for possible extensions
-    (e.g. prioritizing conflicts).
+    (e.g. prioritizing conflicts). Scalar wrapper around naive_conflict_scores.
+    """
+    return float(naive_conflict_scores(distance_m, threshold_m))
+
+
+def _path_samples_xy(traj: Trajectory, dt: float) -> Tuple[np.ndarray, float]:
+    """
+    Sample a trajectory's (x, y) path at its knots plus a uniform dt grid.
+
+    Returns (samples, gap) where every point of the path lies within `gap`
+    meters of some sample (half the longest chord between consecutive
+    samples; the path is straight between them since knots are included).
+    """
+    times = np.union1d(traj.times, traj.uniform_times(dt))
+    xy = traj.sample_positions_at(times)[:, :2].astype(float)
+    chords = np.hypot(*np.diff(xy, axis=0).T)
+    return xy, 0.5 * float(chords.max(initial=0.0))
+
+
+def _prune_far_flights(
+    primary_traj: Trajectory,
+    sim_trajs: List[Trajectory],
+    buffer_m: float,
+    dt: float,
+) -> List[Trajectory]:
+    """
+    Drop simulated flights that cannot conflict with the primary.
+
+    Flights with no temporal overlap are dropped first, without sampling
+    them. The survivors are dropped if their path never comes within
+    buffer_m of the primary's path in (x, y), using a KD-tree over the
+    primary's samples. The query radius is widened by both sampling gaps,
+    so a flight is only dropped when no sampled time of the exact check
+    could violate the buffer (2D separation never exceeds 3D separation,
+    so this also holds for use_3d).
     """
-    if distance_m >= threshold_m:
-        return 0.0
-    if distance_m <= 0.0:
-        return 1.0
-    return (threshold_m - distance_m) / threshold_m
+    t0, t1 = primary_traj.time_range()
+    overlapping = [
+        sim_traj for sim_traj in sim_trajs
+        if min(sim_traj.times[-1], t1) > max(sim_traj.times[0], t0)
+    ]
+    if not overlapping:
+        return []
+
+    primary_xy, primary_gap = _path_samples_xy(primary_traj, dt)
+    tree = cKDTree(primary_xy)
+
+    kept: List[Trajectory] = []
+    for sim_traj in overlapping:
+        sim_xy, sim_gap = _path_samples_xy(sim_traj, dt)
+        radius = buffer_m + primary_gap + sim_gap + 1e-3  # rounding slack
+        dist, _ = tree.query(sim_xy, k=1, distance_upper_bound=radius)
+        if np.isfinite(dist).any():
+            kept.append(sim_traj)
+    return kept
 
 
 def analyze_mission(
@@ -61,39 +128,38 @@ def analyze_mission(
         primary_mission.waypoints,
         mission_window=(primary_mission.start, primary_mission.end),
         max_speed_mps=primary_mission.constraints.get("max_speed_mps", None),
+        positions=primary_mission.positions,
     )
 
-    # Simulated flights: derive their time window from waypoint times
+    # Simulated flights: derive their time window from waypoint times.
+    # flight_id is attached at construction so temporal.py can include it
+    # in conflict explanations.
     sim_trajs: List[Trajectory] = []
     for flight in simulated_flights:
         start, end = flight.time_bounds()  # <- use the helper, no direct .start/.end
         sim_traj = interpolate_from_waypoints(
             flight.waypoints,
             mission_window=(start, end),
+            flight_id=flight.flight_id,
+            positions=flight.positions,
+            times=flight.ts_epoch,
         )
         sim_trajs.append(sim_traj)
 
-    # Attach flight_id to each simulated trajectory so temporal.py
-    # can include it in conflict explanations.
-    sim_trajs_with_ids: List[Trajectory] = [
-        Trajectory(
-            times=traj.times,
-            positions=traj.positions,
-            flight_id=flight.flight_id,
-        )
-        for traj, flight in zip(sim_trajs, simulated_flights)
-    ]
+    # 3) Skip flights whose paths never get near the primary's path
+    candidate_trajs = _prune_far_flights(
+        primary_traj, sim_trajs, safety_buffer, dt)
 
-    # 3) Run spatio-temporal conflict analysis
+    # 4) Run spatio-temporal conflict analysis
     conflict_result = check_spatiotemporal_conflicts(
         primary_traj,
-        sim_trajs_with_ids,
+        candidate_trajs,
         safety_buffer_m=safety_buffer,
         dt=dt,
         use_3d=use_3d,
     )
 
-    # 4) Normalize status to a simple string + full report
+    # 5) Normalize status to a simple string + full report
     status = conflict_result.get("status", "clear")
     if status == "clear":
         return "clear", conflict_result
@@ -1,4 +1,4 @@
-# src/cli.py
+# src/deconflict/cli.py
 
 from __future__ import annotations
 
@@ -6,8 +6,8 @@ import argparse
 import json
 from pathlib import Path
 
-from deconflict import analyzer, io, visualize
-from deconflict.models import PrimaryMission, SimulatedFlight
+from . import analyzer, io
+from .models import PrimaryMission, SimulatedFlight
 
 
 def run_analysis(
@@ -56,10 +56,15 @@ def run_analysis(
         report_path = Path(output_file)
         report_path.parent.mkdir(parents=True, exist_ok=True)
         with report_path.open("w", encoding="utf-8") as f:
-            json.dump({"status": status, "conflicts": conflicts}, f, indent=2)
+            # The analyzer's report is already {"status", "conflicts"}
+            json.dump(conflicts, f, indent=2)
 
-    # Optional animation using mission objects directly
+    # Optional animation using mission objects directly.
+    # visualize (matplotlib) is only imported here: it dominates start-up
+    # time and is not needed for a JSON-only run.
     if animate:
+        from deconflict import visualize
+
         visualize.animate_2d(
             primary_traj=primary_mission,
             sim_trajs=simulated_flights,
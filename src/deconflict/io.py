@@ -2,24 +2,63 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, is_dataclass
+import mmap
+import re
+import time
+from dataclasses import fields, is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List
+from typing import Any, List, Sequence, Tuple
 
-from .models import PrimaryMission, SimulatedFlight, Waypoint
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from .models import POSITION_DTYPE, PrimaryMission, SimulatedFlight, Waypoint
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 DATA_DIR = ROOT_DIR / "data"
 
+# Files below this size are memory-mapped rather than read into a buffer
+MMAP_MAX_BYTES = 5 << 20
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when installed and the stdlib otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_json_file(path: Path) -> Any:
+    """
+    Parse a JSON file, picking the read strategy by size.
+
+    Small (non-empty) files are memory-mapped and handed to orjson as a
+    buffer, skipping the copy into a userspace bytes object; larger files,
+    or any file when only the stdlib parser is available, are read in one
+    read_bytes() call.
+    """
+    size = path.stat().st_size
+    if orjson is not None and 0 < size < MMAP_MAX_BYTES:
+        with path.open("rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            return orjson.loads(view)
+    return _loads(path.read_bytes())
+
 
 def load_json(filename: str) -> Any:
     """
     Load a JSON file from the repo's data/ directory.
     """
     path = DATA_DIR / filename
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json_file(path)
 
 
 # ---------------------------------------------------------------------------
@@ -46,6 +85,52 @@ def parse_iso8601(value: str) -> datetime:
         ) from exc
 
 
+# Trailing "Z" or "+HH:MM" / "-HHMM" UTC offset on an ISO-8601 string
+_TZ_SUFFIX = re.compile(r"(?:Z|[+-]\d{2}:?\d{2})$")
+
+
+def _local_zone_is_utc() -> bool:
+    """True if the process timezone is UTC (checked on every call, as TZ may change)."""
+    return time.daylight == 0 and time.timezone == 0 and time.tzname[0] == "UTC"
+
+
+def parse_iso8601_many(values: Sequence[str]) -> Tuple[List[datetime], np.ndarray]:
+    """
+    Parse many ISO-8601 timestamps at once.
+
+    Returns (datetimes, epoch_seconds) where epoch_seconds is a float64
+    array equal to [dt.timestamp() for dt in datetimes].
+
+    Naive timestamps (the usual case) are parsed in a single NumPy
+    datetime64 pass; when the process runs in UTC the epoch array is
+    derived from it with one vector op as well. Other zones go through
+    timestamp() per value: even without current DST, a zone's UTC offset
+    may have changed over the years (e.g. Europe/Moscow in 2011 and 2014),
+    so a single offset is not safe. Timestamps that
+    carry a Z/offset suffix, anything NumPy rejects, or "NaT", go through
+    parse_iso8601 one by one so aware values keep their tzinfo and errors
+    name the offending string.
+    """
+    if not any(_TZ_SUFFIX.search(v.strip()) for v in values):
+        try:
+            dt64 = np.array([v.strip() for v in values], dtype="datetime64[us]")
+        except ValueError:
+            dt64 = None
+        # NumPy also accepts "NaT" (and ""), which parse_iso8601 rejects:
+        # leave those to the per-string path so the bad value is named
+        if dt64 is not None and not np.isnat(dt64).any():
+            times = dt64.tolist()
+            if _local_zone_is_utc():
+                # Naive datetimes are local time, here UTC: no shift at all
+                epoch = dt64.astype(np.int64) / 1e6
+            else:
+                epoch = np.array([t.timestamp() for t in times], dtype=np.float64)
+            return times, epoch
+
+    times = [parse_iso8601(v) for v in values]
+    return times, np.array([t.timestamp() for t in times], dtype=np.float64)
+
+
 def _ensure_float(name: str, val: Any) -> float:
     try:
         return float(val)
@@ -83,8 +168,7 @@ def load_primary(path: str | Path) -> PrimaryMission:
     if not p.is_file():
         raise FileNotFoundError(f"Primary mission file not found: {p}")
 
-    with p.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = _load_json_file(p)
 
     mission_id = raw.get("mission_id")
     if not mission_id:
@@ -111,6 +195,7 @@ def load_primary(path: str | Path) -> PrimaryMission:
         raise ValueError("Primary mission must contain at least 2 waypoints")
 
     waypoints: List[Waypoint] = []
+    xyz = np.empty((3, len(waypoints_raw)), dtype=POSITION_DTYPE)
     for idx, wp in enumerate(waypoints_raw):
         try:
             x = _ensure_float("x", wp["x"])
@@ -124,16 +209,19 @@ def load_primary(path: str | Path) -> PrimaryMission:
         z = _ensure_float("z", z_val) if z_val is not None else None
         wp_id = wp.get("id")
         waypoints.append(Waypoint(x=x, y=y, z=z, id=wp_id))
+        xyz[:, idx] = (x, y, 0.0 if z is None else z)
 
     constraints = raw.get("constraints") or {}
 
-    return PrimaryMission(
+    mission = PrimaryMission(
         mission_id=mission_id,
         waypoints=waypoints,
         start=start,
         end=end,
         constraints=constraints,
     )
+    mission._xyz = xyz
+    return mission
 
 
 # ---------------------------------------------------------------------------
@@ -163,8 +251,7 @@ def load_simulated_flights(path: str | Path) -> List[SimulatedFlight]:
     if not p.is_file():
         raise FileNotFoundError(f"Simulated flights file not found: {p}")
 
-    with p.open("r", encoding="utf-8") as f:
-        raw_list = json.load(f)
+    raw_list = _load_json_file(p)
 
     if not isinstance(raw_list, list):
         raise ValueError("Simulated flights JSON must be a list of flights")
@@ -184,8 +271,9 @@ def load_simulated_flights(path: str | Path) -> List[SimulatedFlight]:
                 f"Simulated flight {flight_id} must have at least 2 waypoints"
             )
 
-        wps: List[Waypoint] = []
-        times: List[datetime] = []
+        coords: List[Tuple[float, float, float | None, Any]] = []
+        t_strs: List[str] = []
+        xyz = np.empty((3, len(waypoints_raw)), dtype=POSITION_DTYPE)
 
         for j, wp in enumerate(waypoints_raw):
             try:
@@ -204,18 +292,17 @@ def load_simulated_flights(path: str | Path) -> List[SimulatedFlight]:
                 raise ValueError(
                     f"Waypoint {j} of flight {flight_id} missing time 't'"
                 )
-            t = parse_iso8601(t_raw)
-            times.append(t)
-
-            wps.append(
-                Waypoint(
-                    x=x,
-                    y=y,
-                    z=z,
-                    t=t,
-                    id=wp.get("id"),
-                )
-            )
+            t_strs.append(t_raw)
+            coords.append((x, y, z, wp.get("id")))
+            xyz[:, j] = (x, y, 0.0 if z is None else z)
+
+        # Parse all waypoint times of the flight in one pass
+        times, ts_epoch = parse_iso8601_many(t_strs)
+
+        wps: List[Waypoint] = [
+            Waypoint(x=x, y=y, z=z, t=t, id=wp_id)
+            for (x, y, z, wp_id), t in zip(coords, times)
+        ]
 
         # Prefer explicit start/end if present; otherwise derive from waypoint times.
         if "start" in raw and "end" in raw:
@@ -235,15 +322,16 @@ def load_simulated_flights(path: str | Path) -> List[SimulatedFlight]:
             )
 
         metadata = raw.get("metadata") or {}
-        flights.append(
-            SimulatedFlight(
-                flight_id=flight_id,
-                waypoints=wps,
-                start=start,
-                end=end,
-                metadata=metadata,
-            )
+        flight = SimulatedFlight(
+            flight_id=flight_id,
+            waypoints=wps,
+            start=start,
+            end=end,
+            metadata=metadata,
         )
+        flight._xyz = xyz
+        flight._ts_epoch = ts_epoch
+        flights.append(flight)
 
     return flights
 
@@ -254,10 +342,16 @@ def load_simulated_flights(path: str | Path) -> List[SimulatedFlight]:
 
 def _serialize(obj: Any) -> Any:
     """
-    Helper for json.dump so we can serialize dataclasses, datetimes, Paths, etc.
+    Helper for json.dump / orjson.dumps so we can serialize dataclasses,
+    datetimes, Paths, etc.
     """
     if is_dataclass(obj):
-        return asdict(obj)
+        # Public fields only; nested dataclasses come back through here.
+        return {
+            f.name: getattr(obj, f.name)
+            for f in fields(obj)
+            if not f.name.startswith("_")
+        }
     if isinstance(obj, datetime):
         return obj.isoformat()
     if isinstance(obj, Path):
@@ -267,12 +361,40 @@ def _serialize(obj: Any) -> Any:
 
 def save_conflict_report(report: Any, path: str | Path) -> None:
     """
-    Save any JSON-serializable report to disk.
+    Save any JSON-serializable report to disk. Non-finite floats are
+    written as null.
     """
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, default=_serialize)
+    if orjson is not None:
+        # Dataclasses are passed through to _serialize so their private
+        # caches stay out of the report; datetimes/numpy are native.
+        p.write_bytes(
+            orjson.dumps(
+                report,
+                default=_serialize,
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS
+                ),
+            )
+        )
+        return
+    try:
+        text = json.dumps(report, indent=2, default=_serialize, allow_nan=False)
+    except ValueError:
+        # NaN/inf somewhere: write them as null, like orjson does, so the
+        # report does not depend on which encoder is installed
+        text = json.dumps(
+            json.loads(
+                json.dumps(report, default=_serialize),
+                parse_constant=lambda _: None,
+            ),
+            indent=2,
+        )
+    p.write_text(text, encoding="utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -1,12 +1,20 @@
 # src/deconflict/models.py
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict
 
+# Storage dtype for coordinates. Coordinates are absolute (e.g. projected
+# eastings around 5e6 m), where float32 only resolves ~0.5 m - coarser than
+# a tight safety buffer - so positions are kept in float64, like times.
+POSITION_DTYPE = np.float64
 
-class Waypoint(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class Waypoint:
     """
     Single waypoint in space (and optionally time).
     x, y: horizontal coordinates (meters or any consistent unit)
@@ -21,11 +29,28 @@ class Waypoint(BaseModel):
     id: Optional[str] = None
 
 
-class PrimaryMission(BaseModel):
+def _waypoints_xyz(waypoints: List[Waypoint]) -> np.ndarray:
+    """
+    Build a (3, N) SoA array (rows x, y, z) from waypoints.
+    Missing z is treated as 0.0.
+    """
+    return np.array(
+        [
+            [wp.x for wp in waypoints],
+            [wp.y for wp in waypoints],
+            [wp.z if wp.z is not None else 0.0 for wp in waypoints],
+        ],
+        dtype=POSITION_DTYPE,
+    ).reshape(3, len(waypoints))
+
+
+@dataclass(slots=True)
+class PrimaryMission:
     """
     Primary drone mission:
     - mission_id: identifier
-    - waypoints:  route to be flown
+    - waypoints:  route to be flown (reassign the list to change it; the
+                  cached position arrays do not track in-place edits)
     - start/end: overall time window for the mission
     - constraints: optional mission-level parameters
     """
@@ -33,7 +58,17 @@ class PrimaryMission(BaseModel):
     waypoints: List[Waypoint]
     start: datetime
     end: datetime
-    constraints: Dict[str, Any] = Field(default_factory=dict)
+    constraints: Dict[str, Any] = field(default_factory=dict)
+
+    # SoA cache, filled by the JSON loader or lazily on first access
+    _xyz: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name == "waypoints":
+            # A new route invalidates the cache built from the old one
+            object.__setattr__(self, "_xyz", None)
 
     @property
     def duration_s(self) -> float:
@@ -41,52 +76,141 @@ class PrimaryMission(BaseModel):
         return (self.end - self.start).total_seconds()
 
     @property
-    def positions(self) -> List[Tuple[float, float, float]]:
+    def positions_xyz(self) -> np.ndarray:
+        """
+        Waypoint coordinates as contiguous (3, N) POSITION_DTYPE rows x, y, z.
+        Built once (normally by the JSON loader) and cached.
         """
-        Convenience view of all waypoint positions as (x, y, z).
+        if self._xyz is None:
+            self._xyz = _waypoints_xyz(self.waypoints)
+        return self._xyz
+
+    @property
+    def xs(self) -> np.ndarray:
+        """Contiguous x coordinates of the waypoints."""
+        return self.positions_xyz[0]
+
+    @property
+    def ys(self) -> np.ndarray:
+        """Contiguous y coordinates of the waypoints."""
+        return self.positions_xyz[1]
+
+    @property
+    def zs(self) -> np.ndarray:
+        """Contiguous z coordinates of the waypoints."""
+        return self.positions_xyz[2]
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        Convenience (N, 3) view of all waypoint positions as (x, y, z).
         If z is missing, default to 0.0.
         Used by visualization functions.
+
+        Returns a POSITION_DTYPE ndarray (the transpose of positions_xyz),
+        not a list of (x, y, z) tuples as in earlier versions; call
+        .tolist() for the old shape. Treat it as read-only: it aliases the
+        cache.
         """
-        return [
-            (wp.x, wp.y, wp.z if wp.z is not None else 0.0)
-            for wp in self.waypoints
-        ]
+        return self.positions_xyz.T
 
 
-class SimulatedFlight(BaseModel):
+@dataclass(slots=True)
+class SimulatedFlight:
     """
     Other drones' flights used for deconfliction.
     - flight_id: identifier
-    - waypoints: full spatio-temporal path
+    - waypoints: full spatio-temporal path (reassign to change it, as for
+                 PrimaryMission)
     - metadata:  optional extra info (e.g., type, priority)
+    - start/end: optional explicit time window (as given in the JSON)
     """
     flight_id: str
     waypoints: List[Waypoint]
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    # SoA caches, filled by the JSON loader or lazily on first access
+    _xyz: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False)
+    _ts_epoch: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name == "waypoints":
+            # A new route invalidates the caches built from the old one
+            object.__setattr__(self, "_xyz", None)
+            object.__setattr__(self, "_ts_epoch", None)
+
+    @property
+    def positions_xyz(self) -> np.ndarray:
+        """
+        Waypoint coordinates as contiguous (3, N) POSITION_DTYPE rows x, y, z.
+        Built once (normally by the JSON loader) and cached.
+        """
+        if self._xyz is None:
+            self._xyz = _waypoints_xyz(self.waypoints)
+        return self._xyz
+
+    @property
+    def xs(self) -> np.ndarray:
+        """Contiguous x coordinates of the waypoints."""
+        return self.positions_xyz[0]
+
+    @property
+    def ys(self) -> np.ndarray:
+        """Contiguous y coordinates of the waypoints."""
+        return self.positions_xyz[1]
 
     @property
-    def positions(self) -> List[Tuple[float, float, float]]:
+    def zs(self) -> np.ndarray:
+        """Contiguous z coordinates of the waypoints."""
+        return self.positions_xyz[2]
+
+    @property
+    def positions(self) -> np.ndarray:
         """
-        Convenience view of all waypoint positions as (x, y, z).
+        Convenience (N, 3) view of all waypoint positions as (x, y, z).
         If z is missing, default to 0.0.
         Used by visualization functions.
+
+        Returns a POSITION_DTYPE ndarray (the transpose of positions_xyz),
+        not a list of (x, y, z) tuples as in earlier versions; call
+        .tolist() for the old shape. Treat it as read-only: it aliases the
+        cache.
         """
-        return [
-            (wp.x, wp.y, wp.z if wp.z is not None else 0.0)
-            for wp in self.waypoints
-        ]
+        return self.positions_xyz.T
+
+    @property
+    def ts_epoch(self) -> np.ndarray:
+        """
+        Waypoint timestamps as a float64 array of Unix seconds
+        (NaN where a waypoint has no time).
+        """
+        if self._ts_epoch is None:
+            self._ts_epoch = np.array(
+                [wp.t.timestamp() if wp.t is not None else np.nan
+                 for wp in self.waypoints],
+                dtype=np.float64,
+            )
+        return self._ts_epoch
 
     def time_bounds(self) -> Tuple[datetime, datetime]:
         """
         Infer start/end times from waypoint timestamps.
         Raises if no waypoint has time information.
         """
-        times = [wp.t for wp in self.waypoints if wp.t is not None]
-        if not times:
+        ts = self.ts_epoch
+        if np.isnan(ts).all():
             raise ValueError(
                 f"SimulatedFlight {self.flight_id} has no waypoint times"
             )
-        return min(times), max(times)
+        return (
+            self.waypoints[int(np.nanargmin(ts))].t,
+            self.waypoints[int(np.nanargmax(ts))].t,
+        )
 
 
 class MissionRequest(BaseModel):
@@ -97,3 +221,6 @@ class MissionRequest(BaseModel):
     """
     mission: PrimaryMission
     flights: List[SimulatedFlight]
+
+    # The mission dataclasses carry private ndarray caches (init=False)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
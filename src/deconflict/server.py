@@ -0,0 +1,170 @@
+import copy
+import os
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple  # <-- Import Optional
+
+import numpy as np
+from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from pydantic import BaseModel, Field
+
+from .temporal import check_spatiotemporal_conflicts
+from .traject import Trajectory, interpolate_from_waypoints
+
+app = FastAPI()
+
+# Define the Pydantic models for validation
+
+
+class Waypoint(BaseModel):
+    x: float
+    y: float
+    z: Optional[float] = None  # <-- Optional is now recognized
+    t: Optional[datetime] = None
+    id: Optional[str] = None
+
+
+class PrimaryMission(BaseModel):
+    mission_id: str
+    waypoints: List[Waypoint]
+    start: datetime
+    end: datetime
+    constraints: Dict[str, Any] = {}
+
+    @property
+    def duration_s(self) -> float:
+        return (self.end - self.start).total_seconds()
+
+
+class SimulatedFlight(BaseModel):
+    flight_id: str
+    waypoints: List[Waypoint]
+    metadata: Dict[str, Any] = {}
+
+    def time_bounds(self) -> tuple[datetime, datetime]:
+        times = [wp.t for wp in self.waypoints if wp.t is not None]
+        if not times:
+            raise ValueError(
+                f"SimulatedFlight {self.flight_id} has no waypoint times")
+        return min(times), max(times)
+
+# Trajectories of simulated flights, cached across requests: the same
+# traffic is typically posted again and again, the primary mission is not
+
+
+WaypointKey = Tuple[Tuple[float, float, float, float], ...]
+
+
+def _flight_key(flight: SimulatedFlight) -> WaypointKey:
+    """Immutable ((t_unix, x, y, z), ...) knot key for a flight's waypoints."""
+    if any(wp.t is None for wp in flight.waypoints):
+        raise ValueError(
+            f"SimulatedFlight {flight.flight_id} needs a time on every waypoint")
+    return tuple(
+        (wp.t.timestamp(), wp.x, wp.y, 0.0 if wp.z is None else wp.z)
+        for wp in flight.waypoints
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_traj_cached(wp_tuple: WaypointKey) -> Trajectory:
+    """
+    Build (once) the Trajectory of a simulated flight from its key. The
+    result is shared between requests, so its arrays are made read-only.
+    """
+    if len(wp_tuple) < 2:
+        raise ValueError("Need at least 2 waypoints to build a trajectory")
+    traj = Trajectory.from_knots(np.array(wp_tuple, dtype=float))
+    for arr in (traj.times, traj.positions, traj._xyz, traj._dpos_seg, *traj.bbox):
+        arr.flags.writeable = False
+    return traj
+
+
+def _sim_trajectories(flights: List[SimulatedFlight]) -> List[Trajectory]:
+    """Trajectories of all simulated flights, through the cache."""
+    trajs = []
+    for f in flights:
+        # Each request gets its own object (flight_id, bracket cache) over
+        # the shared read-only arrays
+        traj = copy.copy(_build_traj_cached(_flight_key(f)))
+        traj.flight_id = f.flight_id
+        traj._bracket_cache = {}
+        trajs.append(traj)
+    return trajs
+
+
+# Bounds on the sampling grid: a tiny dt or a very long mission window
+# would otherwise allocate an arbitrarily large time grid per request
+MIN_DT_S = 0.01
+MAX_GRID_SAMPLES = 1_000_000
+
+# This model is used to validate the entire incoming request body
+
+
+
+class MissionRequest(BaseModel):
+    mission: PrimaryMission
+    flights: List[SimulatedFlight]
+    safety_buffer_m: float = Field(50.0, ge=0, allow_inf_nan=False)
+    dt: float = Field(1.0, ge=MIN_DT_S, allow_inf_nan=False)
+    use_3d: bool = False
+
+
+def _run_check(mission_data: MissionRequest) -> Dict[str, Any]:
+    """Build the trajectories and run the conflict check (blocking)."""
+    mission = mission_data.mission
+    if mission.duration_s / mission_data.dt > MAX_GRID_SAMPLES:
+        raise ValueError(
+            f"Mission window of {mission.duration_s:g} s at dt={mission_data.dt:g} s "
+            f"exceeds {MAX_GRID_SAMPLES} samples")
+    primary_traj = interpolate_from_waypoints(
+        mission.waypoints,
+        mission_window=(mission.start, mission.end),
+        max_speed_mps=mission.constraints.get("max_speed_mps", None),
+    )
+    sim_trajs = _sim_trajectories(mission_data.flights)
+    return check_spatiotemporal_conflicts(
+        primary_traj,
+        sim_trajs,
+        safety_buffer_m=mission_data.safety_buffer_m,
+        dt=mission_data.dt,
+        use_3d=mission_data.use_3d,
+    )
+
+# POST endpoint to check for mission conflict
+
+
+@app.post("/check")
+async def check_mission(mission_data: MissionRequest):
+    # Trajectory building and the NumPy conflict check are blocking work,
+    # so they run in the threadpool instead of on the event loop
+    try:
+        result = await run_in_threadpool(_run_check, mission_data)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    # {"status": "clear" | "conflict", "conflicts": [...]}
+    return result
+
+# Simple health check
+
+
+@app.get("/health")
+async def health_check():
+    return {"status": "OK"}
+
+# Endpoint to serve visual artifacts (e.g., images, HTML)
+
+
+@app.get("/static/visual/{name}")
+async def get_visual(name: str):
+    # Ensure the path to the visual examples is correct
+    visual_path = f"visual_examples/{name}"
+
+    # Check if the file exists before returning it
+    if os.path.exists(visual_path):
+        return FileResponse(visual_path)
+    else:
+        return {"error": "File not found"}
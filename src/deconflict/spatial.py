@@ -4,9 +4,39 @@ from typing import Dict, Tuple
 
 import numpy as np
 
+from deconflict._kernels import min_dist_idx
 from deconflict.traject import Trajectory
 
 
+def _common_time_grid(
+    traj_A: Trajectory, traj_B: Trajectory, dt_s: float
+) -> np.ndarray:
+    """
+    Union of the uniform sampling grids of A and B (float64 seconds).
+
+    When both grids have the same step and phase, the union is itself a
+    uniform grid and is generated arithmetically; otherwise fall back to
+    np.union1d.
+    """
+    times_A = traj_A.uniform_times(dt_s)
+    times_B = traj_B.uniform_times(dt_s)
+    if times_A.size < 2 or times_B.size < 2:
+        return np.union1d(times_A, times_B)
+
+    step = times_A[1] - times_A[0]
+    offset = (times_B[0] - times_A[0]) / step
+    if (
+        np.isclose(times_B[1] - times_B[0], step, rtol=1e-12, atol=0.0)
+        and np.isclose(offset, np.round(offset), rtol=0.0, atol=1e-9)
+    ):
+        t_start = min(times_A[0], times_B[0])
+        t_end = max(times_A[-1], times_B[-1])
+        n = int(np.round((t_end - t_start) / step)) + 1
+        return t_start + step * np.arange(n)
+
+    return np.union1d(times_A, times_B)
+
+
 def check_spatial_conflict(
     traj_A: Trajectory,
     traj_B: Trajectory,
@@ -27,30 +57,25 @@ def check_spatial_conflict(
         - conflict_detected: True if the minimum distance < buffer_m.
         - details: dictionary with the conflict details.
     """
-    times_A, positions_A = traj_A.sample_uniform(dt_s=1.0)
-    times_B, positions_B = traj_B.sample_uniform(dt_s=1.0)
-
-    # Resample if the time grids are not the same length
-    common_times = np.union1d(times_A, times_B)
-    pos_A_resampled = np.array(
-        [traj_A.sample_position_at(t)[0:2] for t in common_times])
-    pos_B_resampled = np.array(
-        [traj_B.sample_position_at(t)[0:2] for t in common_times])
-
-    # Compute pairwise distances
-    distances = np.linalg.norm(pos_A_resampled - pos_B_resampled, axis=1)
-
-    min_dist = np.min(distances)
-    min_dist_idx = np.argmin(distances)
-    t_A_at_min = common_times[min_dist_idx]
-    t_B_at_min = common_times[min_dist_idx]
+    # Resample both trajectories on a common time grid
+    common_times = _common_time_grid(traj_A, traj_B, dt_s=1.0)
+    pos_A_resampled = traj_A.sample_positions_at(common_times)[:, :2]
+    pos_B_resampled = traj_B.sample_positions_at(common_times)[:, :2]
+
+    # Minimum pairwise distance (single fused pass)
+    min_dist, min_idx = min_dist_idx(
+        pos_A_resampled[:, 0], pos_A_resampled[:, 1],
+        pos_B_resampled[:, 0], pos_B_resampled[:, 1],
+    )
+    t_A_at_min = common_times[min_idx]
+    t_B_at_min = common_times[min_idx]
 
     conflict_detected = min_dist < buffer_m
 
     details = {
         "min_distance_m": min_dist,
-        "min_position_A": pos_A_resampled[min_dist_idx].tolist(),
-        "min_position_B": pos_B_resampled[min_dist_idx].tolist(),
+        "min_position_A": pos_A_resampled[min_idx].tolist(),
+        "min_position_B": pos_B_resampled[min_idx].tolist(),
         "t_A_at_min": t_A_at_min,
         "t_B_at_min": t_B_at_min,
         "conflict_detected": conflict_detected,
@@ -73,26 +98,21 @@ def closest_approach(
         posA: The position at the minimum distance for trajectory A.
         posB: The position at the minimum distance for trajectory B.
     """
-    times_A, positions_A = traj_A.sample_uniform(dt_s=1.0)
-    times_B, positions_B = traj_B.sample_uniform(dt_s=1.0)
-
     # Resample to common time grid
-    common_times = np.union1d(times_A, times_B)
-    pos_A_resampled = np.array(
-        [traj_A.sample_position_at(t)[0:2] for t in common_times])
-    pos_B_resampled = np.array(
-        [traj_B.sample_position_at(t)[0:2] for t in common_times])
-
-    # Calculate pairwise distances
-    distances = np.linalg.norm(pos_A_resampled - pos_B_resampled, axis=1)
+    common_times = _common_time_grid(traj_A, traj_B, dt_s=1.0)
+    pos_A_resampled = traj_A.sample_positions_at(common_times)[:, :2]
+    pos_B_resampled = traj_B.sample_positions_at(common_times)[:, :2]
 
-    min_dist = np.min(distances)
-    min_dist_idx = np.argmin(distances)
+    # Minimum pairwise distance (single fused pass)
+    min_dist, min_idx = min_dist_idx(
+        pos_A_resampled[:, 0], pos_A_resampled[:, 1],
+        pos_B_resampled[:, 0], pos_B_resampled[:, 1],
+    )
 
-    t_A_at_min = common_times[min_dist_idx]
-    t_B_at_min = common_times[min_dist_idx]
+    t_A_at_min = common_times[min_idx]
+    t_B_at_min = common_times[min_idx]
 
-    posA = pos_A_resampled[min_dist_idx]
-    posB = pos_B_resampled[min_dist_idx]
+    posA = pos_A_resampled[min_idx]
+    posB = pos_B_resampled[min_idx]
 
     return min_dist, t_A_at_min, t_B_at_min, tuple(posA), tuple(posB)
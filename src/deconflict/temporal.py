@@ -1,13 +1,164 @@
 # src/deconflict/temporal.py
 from __future__ import annotations
 
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, Hashable, List, Tuple
 
 import numpy as np
 
+from ._compat import HAS_NUMBA
+from ._kernels import conflict_kernel
 from .traject import Trajectory
 
+if HAS_NUMBA:
+    from numba import get_num_threads
+
+
+def _dist2_2d(primary_pos: np.ndarray, sim_pos_stack: np.ndarray) -> np.ndarray:
+    """(F, N) squared (x, y) distances of (F, N, 3) samples to (N, 3) ones."""
+    dx = sim_pos_stack[..., 0] - primary_pos[:, 0]
+    dy = sim_pos_stack[..., 1] - primary_pos[:, 1]
+    return dx * dx + dy * dy
+
+
+def _dist2_3d(primary_pos: np.ndarray, sim_pos_stack: np.ndarray) -> np.ndarray:
+    """(F, N) squared (x, y, z) distances of (F, N, 3) samples to (N, 3) ones."""
+    diff = sim_pos_stack - primary_pos[None]
+    return np.einsum("fij,fij->fi", diff, diff)
+
+
+_ScanResult = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _scan_tensor(
+    primary_traj: Trajectory,
+    sims: List[Trajectory],
+    t_grid: np.ndarray,
+    win_start: np.ndarray,
+    win_end: np.ndarray,
+    buf2: float,
+    use_3d: bool,
+    grid_key: Hashable | None = None,
+) -> _ScanResult:
+    """
+    NumPy conflict scan: sample every flight into one (F, N, 3) tensor and
+    threshold it in a single pass.
+
+    Samples outside a flight's overlap window [win_start, win_end) are
+    masked with +inf. grid_key, if given, identifies t_grid so each
+    trajectory's bracket indices for it are cached (sample_positions_at).
+
+    Returns:
+        (rows, idx, d2, primary_hits, sim_hits): flight row, grid index and
+        squared distance of every violating sample, plus the (K, 3) primary
+        and simulated positions there, in flight-then-time order.
+    """
+    # Distances are taken in float64 whatever the trajectories' storage dtype
+    primary_samples = primary_traj.sample_positions_at(
+        t_grid, grid_key).astype(np.float64, copy=False)
+    sim_all = np.empty((len(sims), t_grid.size, 3), dtype=np.float64)
+    for row, sim_traj in enumerate(sims):
+        sim_all[row] = sim_traj.sample_positions_at(t_grid, grid_key)
+    outside = (t_grid < win_start[:, None]) | (t_grid >= win_end[:, None])
+    sim_all[outside] = np.inf
+
+    # Only the buffer comparison matters for detection, so it is done on
+    # squared distances; callers take the sqrt of the few flagged samples
+    dist2 = _dist2_3d if use_3d else _dist2_2d
+    d2 = dist2(primary_samples, sim_all)
+    rows, idx = np.nonzero(d2 < buf2)
+    return rows, idx, d2[rows, idx], primary_samples[idx], sim_all[rows, idx]
+
+
+def _check_one(
+    primary_traj: Trajectory,
+    sim_traj: Trajectory,
+    t_window: np.ndarray,
+    buf2: float,
+    use_3d: bool,
+    parallel: bool = True,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Check one simulated flight over its slice of the grid with the fused
+    conflict_kernel.
+
+    Returns (idx, d2, sim_hits): indices into t_window of the violating
+    samples, their squared distances and the (K, 3) simulated positions.
+    """
+    idx, d2 = conflict_kernel(
+        primary_traj.times, primary_traj.positions_xyz,
+        sim_traj.times, sim_traj.positions_xyz,
+        t_window, buf2, use_3d, parallel,
+    )
+    return idx, d2, sim_traj.sample_positions_at(t_window[idx])
+
+
+def _scan_compiled(
+    primary_traj: Trajectory,
+    sims: List[Trajectory],
+    t_grid: np.ndarray,
+    win_start: np.ndarray,
+    win_end: np.ndarray,
+    buf2: float,
+    use_3d: bool,
+    grid_key: Hashable | None = None,
+) -> _ScanResult:
+    """
+    Numba conflict scan: run _check_one over each flight's slice of the
+    grid; positions are only sampled at violating times.
+
+    Several flights are checked concurrently on a thread pool (the kernel
+    releases the GIL); a single flight uses the prange-parallel kernel
+    instead, but only from the main thread: a parallel region launched
+    from another thread (e.g. a web server's worker pool) can hang
+    interpreter exit under the TBB threading layer.
+
+    Same contract as _scan_tensor; grid_key is unused (the kernel does its
+    own per-sample search).
+    """
+    lo_hi = np.searchsorted(t_grid, np.stack([win_start, win_end], axis=1))
+    windows = [t_grid[lo:hi] for lo, hi in lo_hi]
+
+    if len(sims) == 1:
+        parallel = threading.current_thread() is threading.main_thread()
+        results = [_check_one(primary_traj, sims[0], windows[0], buf2, use_3d,
+                              parallel)]
+    else:
+        check = partial(_check_one, primary_traj, buf2=buf2, use_3d=use_3d,
+                        parallel=False)
+        # Honour the Numba thread limit (NUMBA_NUM_THREADS /
+        # set_num_threads), e.g. inside process-pool workers
+        n_workers = min(len(sims), get_num_threads())
+        with ThreadPoolExecutor(max_workers=n_workers) as ex:
+            results = list(ex.map(check, sims, windows))
+
+    rows, idxs, d2s, sim_hits = [], [], [], []
+    for row, ((lo, _), (idx, d2, hits)) in enumerate(zip(lo_hi, results)):
+        if idx.size == 0:
+            continue
+        rows.append(np.full(idx.size, row))
+        idxs.append(idx + lo)
+        d2s.append(d2)
+        sim_hits.append(hits)
+
+    if not idxs:
+        empty = np.empty((0, 3), dtype=primary_traj.positions.dtype)
+        none = np.empty(0, dtype=np.intp)
+        return none, none, np.empty(0), empty, empty
+
+    idx = np.concatenate(idxs)
+    return (
+        np.concatenate(rows),
+        idx,
+        np.concatenate(d2s),
+        primary_traj.sample_positions_at(t_grid[idx]),
+        np.concatenate(sim_hits),
+    )
+
 
 def check_spatiotemporal_conflicts(
     primary_traj: Trajectory,
@@ -33,75 +184,111 @@ def check_spatiotemporal_conflicts(
           "conflicts": [ { ... conflict detail ... }, ... ]
         }
     """
-    conflicts: List[Dict[str, Any]] = []
+    # Validate before squaring: a negative buffer would square to a
+    # positive threshold
+    safety_buffer_m = float(safety_buffer_m)
+    if not math.isfinite(safety_buffer_m) or safety_buffer_m < 0:
+        raise ValueError("safety_buffer_m must be a finite, non-negative number")
+    # Distances are compared squared (in float64)
+    buf2 = safety_buffer_m * safety_buffer_m
+    # A non-positive dt gives an empty grid (every window would then be
+    # checked at its start only) or a ZeroDivisionError
+    dt = float(dt)
+    if not math.isfinite(dt) or dt <= 0:
+        raise ValueError("dt must be a finite, positive number")
 
     # Time range of primary trajectory (in seconds)
     primary_t0, primary_t1 = primary_traj.time_range()
 
-    for sim_traj in sim_trajs:
-        # Time range of simulated trajectory
-        sim_t0, sim_t1 = sim_traj.time_range()
-
-        # Overlapping time window
-        overlap_start = max(primary_t0, sim_t0)
-        overlap_end = min(primary_t1, sim_t1)
+    # Overlap windows of all flights at once; flights with no temporal
+    # overlap cannot conflict and are culled before any sampling
+    n_sims = len(sim_trajs)
+    sim_t0 = np.fromiter((s.times[0] for s in sim_trajs), float, n_sims)
+    sim_t1 = np.fromiter((s.times[-1] for s in sim_trajs), float, n_sims)
+    overlap_start = np.maximum(sim_t0, primary_t0)
+    overlap_end = np.minimum(sim_t1, primary_t1)
+    active = np.flatnonzero(overlap_end > overlap_start)
 
-        if overlap_end <= overlap_start:
-            # No temporal overlap => no possible spatio-temporal conflict
-            continue
+    # Spatial cull: a flight whose bounding box, grown by the buffer, does
+    # not reach the primary's box can never come within the buffer
+    dims = 3 if use_3d else 2
+    if active.size:
+        p_lo, p_hi = primary_traj.bbox
+        s_lo = np.stack([sim_trajs[i].bbox[0] for i in active])
+        s_hi = np.stack([sim_trajs[i].bbox[1] for i in active])
+        near = np.all(
+            (s_lo[:, :dims] <= p_hi[:dims] + safety_buffer_m)
+            & (p_lo[:dims] <= s_hi[:, :dims] + safety_buffer_m),
+            axis=1,
+        )
+        active = active[near]
 
-        # Sample times in the overlap window
-        t_grid = np.arange(overlap_start, overlap_end, dt)
-        if t_grid.size == 0:
-            continue
+    if active.size == 0:
+        return {"status": "clear", "conflicts": []}
 
-        # Sample positions at each time (cast NumPy scalars to float for type checkers)
-        primary_samples = np.array(
-            [primary_traj.sample_position_at(float(t))[0:3] for t in t_grid]
-        )
-        sim_samples = np.array(
-            [sim_traj.sample_position_at(float(t))[0:3] for t in t_grid]
-        )
+    # One master grid over the primary window, shared by all flights
+    t_grid = np.arange(primary_t0, primary_t1, dt)
+    grid_key: Hashable = ("arange", primary_t0, primary_t1, float(dt))
+    win_start, win_end = overlap_start[active], overlap_end[active]
 
-        # 2D vs 3D distance
-        dims = 3 if use_3d else 2
-        primary_xy = primary_samples[:, :dims]
-        sim_xy = sim_samples[:, :dims]
+    # A window that falls between two ticks would never be sampled; give
+    # each such flight its window start as an extra grid time
+    between_ticks = (np.searchsorted(t_grid, win_start)
+                     == np.searchsorted(t_grid, win_end))
+    if between_ticks.any():
+        extra = np.unique(win_start[between_ticks])
+        t_grid = np.union1d(t_grid, extra)
+        grid_key = grid_key + tuple(extra.tolist())
 
-        # Euclidean distance at each sampled time
-        dists = np.linalg.norm(primary_xy - sim_xy, axis=1)
+    scan = _scan_compiled if HAS_NUMBA else _scan_tensor
+    rows, conflict_idx, conflict_d2, primary_hits, sim_hits = scan(
+        primary_traj,
+        [sim_trajs[i] for i in active],
+        t_grid,
+        win_start,
+        win_end,
+        buf2,
+        use_3d,
+        grid_key,
+    )
 
-        # Indices where the safety buffer is violated
-        conflict_indices = np.where(dists < safety_buffer_m)[0]
+    # Build conflict entries (flight order, then time order); only the
+    # flagged samples need a real distance
+    conflict_dists = np.sqrt(conflict_d2).tolist()
 
-        if conflict_indices.size == 0:
-            continue
+    # Convert everything to Python objects in bulk: each distinct time is
+    # formatted once and the position rows go through a single tolist()
+    # We treat trajectory time as "seconds since epoch" for formatting;
+    # tests only care that this is a valid ISO string, not the exact date.
+    uniq_t, t_inv = np.unique(t_grid[conflict_idx], return_inverse=True)
+    uniq_iso = [datetime.utcfromtimestamp(t).isoformat() for t in uniq_t.tolist()]
+    conflict_isos = [uniq_iso[i] for i in t_inv.tolist()]
+    primary_rows = primary_hits.tolist()
+    sim_rows = sim_hits.tolist()
+    flight_ids = [getattr(sim_trajs[i], "flight_id", "unknown") for i in active]
 
-        # Build conflict entries
-        for idx in conflict_indices:
-            t_val = float(t_grid[idx])
-            # We treat trajectory time as "seconds since epoch" for formatting;
-            # tests only care that this is a valid ISO string, not the exact date.
-            t_iso = datetime.utcfromtimestamp(t_val).isoformat()
-
-            conflict_details: Dict[str, Any] = {
-                "flight_id": getattr(sim_traj, "flight_id", "unknown"),
-                "conflict_times": [t_iso],
-                "conflict_positions": [
-                    {
-                        "primary": primary_samples[idx].tolist(),
-                        "sim": sim_samples[idx].tolist(),
-                    }
-                ],
-                "min_distance_m": float(dists[idx]),
-                "time_of_min": t_iso,
-                "explanation": (
-                    f"At {t_iso}, primary and {getattr(sim_traj, 'flight_id', 'unknown')} "
-                    f"were within {dists[idx]:.2f} m at position "
-                    f"{primary_samples[idx][:2].tolist()}"
-                ),
-            }
-            conflicts.append(conflict_details)
+    conflicts: List[Dict[str, Any]] = [
+        {
+            "flight_id": flight_ids[f],
+            "conflict_times": [t_iso],
+            "conflict_positions": [
+                {
+                    "primary": primary_row,
+                    "sim": sim_row,
+                }
+            ],
+            "min_distance_m": dist,
+            "time_of_min": t_iso,
+            "explanation": (
+                f"At {t_iso}, primary and {flight_ids[f]} "
+                f"were within {dist:.2f} m at position "
+                f"{primary_row[:2]}"
+            ),
+        }
+        for f, t_iso, dist, primary_row, sim_row in zip(
+            rows.tolist(), conflict_isos, conflict_dists, primary_rows, sim_rows
+        )
+    ]
 
     if conflicts:
         return {"status": "conflict", "conflicts": conflicts}
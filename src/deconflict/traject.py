@@ -2,13 +2,80 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import copy
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable, List, Sequence, Tuple
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, List, Sequence, Tuple
 
 import numpy as np
 
-from .models import Waypoint
+from .models import POSITION_DTYPE, Waypoint, _waypoints_xyz
+
+# Max number of bracket-index arrays kept per Trajectory
+BRACKET_CACHE_SIZE = 8
+TRAJECTORY_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=4096)
+def _aware_epoch(dt: datetime, fold: int) -> float:
+    # fold is part of the key: datetimes differing only in fold compare
+    # (and hash) equal but map to different instants
+    return dt.timestamp()
+
+
+def _to_epoch(dt: datetime) -> float:
+    """
+    datetime -> float Unix seconds. Aware datetimes are cached, since the
+    same mission/waypoint times are converted again and again; naive ones
+    depend on the process timezone (which may change) and are converted
+    directly.
+    """
+    if dt.utcoffset() is None:
+        return dt.timestamp()
+    return _aware_epoch(dt, dt.fold)
+
+
+def _bracket_indices(t_query: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """
+    Segment index i of every (already clamped) query time, such that
+    times[i] <= t <= times[i + 1].
+    """
+    idx = np.searchsorted(times, t_query, side="right") - 1
+    np.clip(idx, 0, times.shape[0] - 2, out=idx)
+    return idx
+
+
+def _interp_nd(
+    t_query: np.ndarray,
+    times: np.ndarray,
+    positions: np.ndarray,
+    dpos_seg: np.ndarray | None = None,
+    idx: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Piecewise-linear interpolation of all columns of `positions` at once.
+
+    One np.searchsorted finds the segment of every query time (clamped to
+    [times[0], times[-1]]), the weight w is computed once, and the (M, D)
+    result is gathered in a single fused expression instead of one
+    np.interp pass per axis.
+
+    dpos_seg: optional precomputed np.diff(positions, axis=0).
+    idx: optional precomputed bracket indices (see _bracket_indices); the
+         search is skipped and only the weights are recomputed.
+    """
+    t_query = np.clip(np.asarray(t_query, dtype=float), times[0], times[-1])
+    if idx is None:
+        idx = _bracket_indices(t_query, times)
+    t0 = times[idx]
+    w = ((t_query - t0) / (times[idx + 1] - t0)).astype(positions.dtype)
+    if dpos_seg is None:
+        dpos = positions[idx + 1] - positions[idx]
+    else:
+        dpos = dpos_seg[idx]
+    return positions[idx] + w[:, None] * dpos
 
 
 @dataclass
@@ -17,26 +84,96 @@ class Trajectory:
     Time-parameterized trajectory.
 
     times: 1D array of float seconds (e.g. Unix timestamps).
-    positions: Nx3 array of [x, y, z] in meters.
+    positions: Nx3 array of [x, y, z] in meters, stored as POSITION_DTYPE
+               (float64). Storage is SoA: positions is the (N, 3) view of a
+               contiguous (3, N) array, so each axis (xs / ys / zs) is a
+               unit-stride row.
     flight_id: ID of the flight to which this trajectory corresponds (optional for primary mission).
+    dtype: position dtype (default POSITION_DTYPE, float64). Times always
+           stay float64, since absolute Unix timestamps need the range, and
+           conflict distances are computed in float64 whatever the dtype.
     """
     times: np.ndarray  # shape (N,)
     positions: np.ndarray  # shape (N, 3)
     flight_id: str = "primary"  # Default to "primary" for primary missions
+    dtype: type = field(default=POSITION_DTYPE, repr=False, compare=False)
+
+    # SoA position storage and per-segment lookup table, built once in
+    # __post_init__
+    _xyz: np.ndarray = field(init=False, repr=False, compare=False)
+    _dpos_seg: np.ndarray = field(init=False, repr=False, compare=False)
+    # Axis-aligned bounding box (min_xyz, max_xyz), for cheap culling
+    bbox: Tuple[np.ndarray, np.ndarray] = field(init=False, repr=False, compare=False)
+    # Bracket indices of repeatedly sampled grids, keyed by caller-chosen keys
+    _bracket_cache: Dict[Hashable, np.ndarray] = field(
+        init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        self.times = np.asarray(self.times, dtype=float)
-        self.positions = np.asarray(self.positions, dtype=float)
+        self.times = np.ascontiguousarray(self.times, dtype=float)
+        positions = np.asarray(self.positions, dtype=self.dtype)
 
         if self.times.ndim != 1:
             raise ValueError("times must be a 1D array")
-        if self.positions.ndim != 2 or self.positions.shape[1] != 3:
+        if positions.ndim != 2 or positions.shape[1] != 3:
             raise ValueError("positions must be of shape (N, 3)")
-        if self.times.shape[0] != self.positions.shape[0]:
+        if self.times.shape[0] != positions.shape[0]:
             raise ValueError("times and positions length mismatch")
-        if np.any(np.diff(self.times) <= 0):
+        dt = np.diff(self.times)
+        if dt.size and dt.min() <= 0:
             raise ValueError("times must be strictly increasing")
 
+        # No copy when positions is already the .T view of a (3, N) array
+        # (e.g. PrimaryMission.positions)
+        self._xyz = np.ascontiguousarray(positions.T)
+        self.positions = self._xyz.T
+        self._dpos_seg = np.diff(self._xyz, axis=1).T
+        self.bbox = (self._xyz.min(axis=1), self._xyz.max(axis=1))
+        self._bracket_cache = {}
+
+    @property
+    def positions_xyz(self) -> np.ndarray:
+        """(3, N) SoA positions; rows are x, y, z."""
+        return self._xyz
+
+    @property
+    def xs(self) -> np.ndarray:
+        """Contiguous x coordinates."""
+        return self._xyz[0]
+
+    @property
+    def ys(self) -> np.ndarray:
+        """Contiguous y coordinates."""
+        return self._xyz[1]
+
+    @property
+    def zs(self) -> np.ndarray:
+        """Contiguous z coordinates."""
+        return self._xyz[2]
+
+    @classmethod
+    def from_knots(cls, knots: np.ndarray, flight_id: str = "primary") -> "Trajectory":
+        """
+        Build a Trajectory from one (N, 4) knot buffer with columns
+        [t, x, y, z] (t in float seconds).
+        """
+        knots = np.asarray(knots, dtype=float)
+        if knots.ndim != 2 or knots.shape[1] != 4:
+            raise ValueError("knots must be of shape (N, 4)")
+        return cls(times=knots[:, 0], positions=knots[:, 1:], flight_id=flight_id)
+
+    @property
+    def knots(self) -> np.ndarray:
+        """
+        Read-only (N, 4) float64 [t, x, y, z] copy of the knots, the
+        inverse of from_knots. Sampling itself runs on the float64 times
+        and the SoA position rows.
+        """
+        knots = np.empty((self.times.shape[0], 4), dtype=float)
+        knots[:, 0] = self.times
+        knots[:, 1:] = self.positions
+        knots.flags.writeable = False
+        return knots
+
     # ----------------- Basic helpers -----------------
 
     def time_range(self) -> Tuple[float, float]:
@@ -47,34 +184,54 @@ class Trajectory:
         """
         Sample position at time t via linear interpolation.
 
-        - If t is datetime: converted to seconds via datetime.timestamp().
+        - If t is datetime: converted to seconds via datetime.timestamp()
+          (see _to_epoch).
         - If t is float: assumed to be in the same time base as self.times.
         - Outside the range: clamp to first / last position.
+
+        Thin wrapper around sample_positions_at; prefer that for many times.
         """
         if isinstance(t, datetime):
-            t_val = t.timestamp()
+            t_val = _to_epoch(t)
         else:
             t_val = float(t)
 
-        if t_val <= self.times[0]:
-            pos = self.positions[0]
-        elif t_val >= self.times[-1]:
-            pos = self.positions[-1]
-        else:
-            x = np.interp(t_val, self.times, self.positions[:, 0])
-            y = np.interp(t_val, self.times, self.positions[:, 1])
-            z = np.interp(t_val, self.times, self.positions[:, 2])
-            pos = np.array([x, y, z], dtype=float)
+        x, y, z = self.sample_positions_at(np.array([t_val]))[0].tolist()
+        return x, y, z
 
-        return float(pos[0]), float(pos[1]), float(pos[2])
-
-    def sample_uniform(self, dt_s: float) -> Tuple[np.ndarray, np.ndarray]:
+    def sample_positions_at(
+        self, ts: np.ndarray, cache_key: Hashable | None = None
+    ) -> np.ndarray:
         """
-        Sample trajectory on a uniform time grid with step dt_s (seconds).
+        Vectorized counterpart of sample_position_at.
 
-        Returns:
-          times_out: 1D array of times
-          positions_out: Nx3 array of positions
+        ts: 1D array of float seconds in the same time base as self.times.
+        Returns an (N, 3) array of positions; times outside the range are
+        clamped to the first / last position.
+
+        One binary search locates the segment of every query time, then
+        positions are gathered from the cached segment table.
+
+        cache_key: optional hashable that identifies the grid ts (e.g.
+        ("arange", t0, t1, dt)). The bracket indices of that grid are kept
+        on the trajectory, so sampling the same grid again skips the
+        search. times are treated as immutable.
+        """
+        ts = np.clip(np.asarray(ts, dtype=float), self.times[0], self.times[-1])
+        idx = None
+        if cache_key is not None:
+            idx = self._bracket_cache.get(cache_key)
+            if idx is None or idx.shape != ts.shape:
+                if len(self._bracket_cache) >= BRACKET_CACHE_SIZE:
+                    self._bracket_cache.clear()
+                idx = _bracket_indices(ts, self.times)
+                self._bracket_cache[cache_key] = idx
+        return _interp_nd(ts, self.times, self.positions, self._dpos_seg, idx)
+
+    def uniform_times(self, dt_s: float) -> np.ndarray:
+        """
+        Uniform float64 time grid over [t0, t1] with step ~dt_s (seconds).
+        Both endpoints are included; this is the grid used by sample_uniform.
         """
         if dt_s <= 0:
             raise ValueError("dt_s must be positive")
@@ -84,13 +241,19 @@ class Trajectory:
             raise ValueError("Invalid time range")
 
         n_steps = int(np.floor((t1 - t0) / dt_s)) + 1
-        times_out = np.linspace(t0, t1, n_steps)
+        return np.linspace(t0, t1, n_steps)
 
-        xs = np.interp(times_out, self.times, self.positions[:, 0])
-        ys = np.interp(times_out, self.times, self.positions[:, 1])
-        zs = np.interp(times_out, self.times, self.positions[:, 2])
-        positions_out = np.stack([xs, ys, zs], axis=1)
+    def sample_uniform(self, dt_s: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sample trajectory on a uniform time grid with step dt_s (seconds).
 
+        Returns:
+          times_out: 1D array of times
+          positions_out: Nx3 array of positions
+        """
+        times_out = self.uniform_times(dt_s)
+        positions_out = self.sample_positions_at(
+            times_out, cache_key=("uniform", float(dt_s)))
         return times_out, positions_out
 
 
@@ -100,15 +263,11 @@ class Trajectory:
 
 def _waypoints_to_positions(waypoints: Sequence[Waypoint]) -> np.ndarray:
     """
-    Convert a list of Waypoints to an (N,3) positions array.
+    Convert a list of Waypoints to an (N,3) positions array, returned as
+    the view of a contiguous (3, N) x / y / z array (see Trajectory).
     Missing z is treated as 0.0.
     """
-    positions = np.zeros((len(waypoints), 3), dtype=float)
-    for i, wp in enumerate(waypoints):
-        positions[i, 0] = float(wp.x)
-        positions[i, 1] = float(wp.y)
-        positions[i, 2] = 0.0 if wp.z is None else float(wp.z)
-    return positions
+    return _waypoints_xyz(waypoints).T
 
 
 def _compute_times_from_window(
@@ -125,17 +284,19 @@ def _compute_times_from_window(
     """
     start_dt, end_dt = mission_window
     duration_s = (end_dt - start_dt).total_seconds()
+    t0_f = _to_epoch(start_dt)
     if duration_s <= 0:
         raise ValueError("mission_window duration must be positive")
 
-    # Distances between consecutive points
-    seg_lengths = np.linalg.norm(np.diff(positions, axis=0), axis=1)
+    # Distances between consecutive points (float64: these set the times),
+    # as one fused dot-squared reduction
+    diffs = np.diff(np.asarray(positions, dtype=float), axis=0)
+    seg_lengths = np.sqrt(np.einsum("ij,ij->i", diffs, diffs))
     total_dist = float(seg_lengths.sum())
 
     if total_dist <= 0:
         # All waypoints at same position -> just distribute times evenly
-        times = np.linspace(start_dt.timestamp(),
-                            end_dt.timestamp(), positions.shape[0])
+        times = np.linspace(t0_f, _to_epoch(end_dt), positions.shape[0])
         return times
 
     required_speed = total_dist / duration_s  # m/s
@@ -148,7 +309,7 @@ def _compute_times_from_window(
     # Time at each waypoint proportional to cumulative distance
     cum_dist = np.concatenate([[0.0], np.cumsum(seg_lengths)])
     fractions = cum_dist / total_dist  # from 0 to 1
-    times = start_dt.timestamp() + fractions * duration_s
+    times = t0_f + fractions * duration_s
     return times
 
 
@@ -158,6 +319,8 @@ def interpolate_from_waypoints(
     mission_window: Tuple[datetime, datetime] | None = None,
     max_speed_mps: float | None = None,
     flight_id: str = "primary",  # Default to "primary" for primary missions
+    positions: np.ndarray | None = None,
+    times: np.ndarray | None = None,
 ) -> Trajectory:
     """
     Build a Trajectory from a sequence of Waypoints.
@@ -176,6 +339,10 @@ def interpolate_from_waypoints(
        - If max_speed_mps is provided, we enforce that required average
          speed over the whole mission does not exceed it.
 
+    positions / times: optional precomputed (N,3) positions and (N,) Unix
+    times (e.g. the SoA arrays of PrimaryMission / SimulatedFlight). When
+    given they are used directly instead of being rebuilt from the waypoints.
+
     For now only 'linear' interpolation is supported.
     """
     if method != "linear":
@@ -185,14 +352,85 @@ def interpolate_from_waypoints(
     if len(waypoints) < 2:
         raise ValueError("Need at least 2 waypoints to build a trajectory")
 
-    positions = _waypoints_to_positions(waypoints)
+    # Re-running the same mission (CLI replays, repeated /check requests,
+    # scenario sweeps) rebuilds an identical trajectory; serve it from cache
+    # when the inputs are hashable and nothing was precomputed by the caller.
+    if positions is None and times is None:
+        key = (tuple(waypoints),
+               tuple(mission_window) if mission_window is not None else None,
+               max_speed_mps)
+        try:
+            hash(key)
+        except TypeError:
+            pass
+        else:
+            shared = _interpolate_from_waypoints_cached(*key, _time_key(key))
+            # Callers get their own object (flight_id, bracket cache) over
+            # the shared read-only arrays
+            traj = copy.copy(shared)
+            traj.flight_id = flight_id
+            traj._bracket_cache = {}
+            return traj
+
+    return _build_trajectory(
+        waypoints, mission_window, max_speed_mps, flight_id, positions, times)
+
+
+def _time_key(key: Tuple) -> Hashable:
+    """
+    What the epoch conversion of the datetimes in a cache key depends on
+    beyond equality: their folds (equal datetimes may differ in fold) and,
+    if any is naive, the process timezone.
+    """
+    wps_tuple, mission_window, _ = key
+    dts = [wp.t for wp in wps_tuple if wp.t is not None]
+    dts.extend(mission_window or ())
+    folds = tuple(dt.fold for dt in dts)
+    if any(dt.utcoffset() is None for dt in dts):
+        return folds, (time.timezone, time.altzone, time.tzname)
+    return folds, None
+
+
+@lru_cache(maxsize=TRAJECTORY_CACHE_SIZE)
+def _interpolate_from_waypoints_cached(
+    wps_tuple: Tuple[Waypoint, ...],
+    mission_window: Tuple[datetime, datetime] | None,
+    max_speed_mps: float | None,
+    time_key: Hashable,
+) -> Trajectory:
+    """
+    Cached build of a waypoint trajectory. The result's arrays are shared
+    between callers, so they are made read-only. time_key (see _time_key)
+    only takes part in the cache key.
+    """
+    traj = _build_trajectory(
+        wps_tuple, mission_window, max_speed_mps, "primary", None, None)
+    for arr in (traj.times, traj.positions, traj._xyz, traj._dpos_seg, *traj.bbox):
+        arr.flags.writeable = False
+    return traj
+
+
+def _build_trajectory(
+    waypoints: Sequence[Waypoint],
+    mission_window: Tuple[datetime, datetime] | None,
+    max_speed_mps: float | None,
+    flight_id: str,
+    positions: np.ndarray | None,
+    times: np.ndarray | None,
+) -> Trajectory:
+    if positions is None:
+        positions = _waypoints_to_positions(waypoints)
+
+    # Case 0: caller already supplied absolute times
+    if times is not None:
+        times = np.asarray(times, dtype=float)
 
     # Case 1: per-waypoint absolute times present
-    if any(wp.t is not None for wp in waypoints):
+    elif any(wp.t is not None for wp in waypoints):
         if not all(wp.t is not None for wp in waypoints):
             raise ValueError(
                 "Either all or none of the waypoints must have t set")
-        times = np.array([wp.t.timestamp() for wp in waypoints], dtype=float)
+        times = np.array([_to_epoch(wp.t) for wp in waypoints], dtype=float)
 
     # Case 2: mission_window-based timing for primary mission
     else:
@@ -1,17 +1,47 @@
 # src/deconflict/visualize.py
 
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import IO, List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 import plotly.graph_objs as go
-from matplotlib.animation import FuncAnimation
-from matplotlib.patches import Circle
+from matplotlib.animation import FuncAnimation, MovieWriter
+from matplotlib.collections import EllipseCollection, LineCollection
 
 # Define types for clarity
 Point2D = Tuple[float, float]
 Path2D = List[Point2D]
 
+# Shared 3D layout; go.Figure copies it, so one validated instance is enough
+_LAYOUT_3D = go.Layout(
+    title='3D UAV Trajectories',
+    scene=dict(
+        xaxis_title='X',
+        yaxis_title='Y',
+        zaxis_title='Z',
+    ),
+)
+
+
+@lru_cache(maxsize=1)
+def _get_template_figure(style: str):
+    """Figure and axes reused across calls of the given plot style."""
+    return plt.subplots(figsize=(8, 8))
+
+
+def _template_axes(style: str):
+    """
+    Cleared (fig, ax) from the template cache. A template closed through
+    pyplot is dropped and rebuilt so show() still has a managed figure.
+    """
+    fig, ax = _get_template_figure(style)
+    if not plt.fignum_exists(fig.number):
+        _get_template_figure.cache_clear()
+        fig, ax = _get_template_figure(style)
+    ax.clear()
+    return fig, ax
+
 # Function to plot 2D paths
 
 
@@ -21,9 +51,8 @@ def plot_2d_paths(paths: List[Path2D]) -> None:
     Each path = sequence of (x, y) pairs.
     """
     for path in paths:
-        xs = [p[0] for p in path]
-        ys = [p[1] for p in path]
-        plt.plot(xs, ys, marker="o")
+        xy = np.asarray(path, dtype=float).reshape(-1, 2)
+        plt.plot(xy[:, 0], xy[:, 1], marker="o")
 
     plt.xlabel("x [m]")
     plt.ylabel("y [m]")
@@ -35,7 +64,7 @@ def plot_2d_paths(paths: List[Path2D]) -> None:
 # Static 2D plot for UAV trajectories and potential conflicts
 
 
-def plot_static_2d(primary_traj, sim_trajs, buffer_m: Optional[float] = None, show: bool = True, save_path: Optional[str] = None) -> None:
+def plot_static_2d(primary_traj, sim_trajs, buffer_m: Optional[float] = None, show: bool = True, save_path: Optional[Union[str, IO[bytes]]] = None, dpi: int = 300) -> None:
     """
     Plot static 2D paths for the primary drone and simulated flights. If buffer_m or conflicts are given,
     highlight conflict positions.
@@ -45,44 +74,46 @@ def plot_static_2d(primary_traj, sim_trajs, buffer_m: Optional[float] = None, sh
         sim_trajs: List of Trajectories for simulated drones.
         buffer_m: Optional buffer radius to show conflict areas.
         show: Whether to display the plot.
-        save_path: If given, save the plot as an image.
+        save_path: If given, save the plot as an image (path or binary file-like).
+        dpi: Resolution of the saved image.
     """
-    fig, ax = plt.subplots(figsize=(8, 8))
+    fig, ax = _template_axes('2d')
+    primary_pos = primary_traj.positions
+    px, py = primary_pos[:, 0], primary_pos[:, 1]
 
     # Plot primary drone trajectory
     ax.plot(
-        [pos[0] for pos in primary_traj.positions],
-        [pos[1] for pos in primary_traj.positions],
+        px,
+        py,
         label="Primary Mission",
         linewidth=2,
         color="b",
     )
 
-    # Plot simulated flights
-    for traj in sim_trajs:
-        ax.plot(
-            [pos[0] for pos in traj.positions],
-            [pos[1] for pos in traj.positions],
-            label=f"Simulated {traj.flight_id}",
-            linestyle="--",
-            color="r",
-        )
+    # Plot simulated flights as one collection of polylines
+    sim_paths = [traj.positions[:, :2] for traj in sim_trajs]
+    if sim_paths:
+        ax.add_collection(LineCollection(
+            sim_paths, label="Simulated Flights", linestyles="--", colors="r"))
+        ax.autoscale_view()
 
     # Plot waypoints for primary and simulated flights
-    ax.scatter([pos[0] for pos in primary_traj.positions], [pos[1]
-               for pos in primary_traj.positions], color='b', zorder=5, label="Primary Waypoints")
-    for traj in sim_trajs:
-        ax.scatter([pos[0] for pos in traj.positions], [pos[1] for pos in traj.positions],
-                   color='r', zorder=5, label=f"Simulated {traj.flight_id} Waypoints")
+    ax.scatter(px, py, color='b', zorder=5, label="Primary Waypoints")
+    if sim_paths:
+        sim_points = np.vstack(sim_paths)
+        ax.scatter(sim_points[:, 0], sim_points[:, 1],
+                   color='r', zorder=5, label="Simulated Waypoints")
 
     # If buffer is provided, mark the conflict regions
-    if buffer_m is not None:
-        for traj in sim_trajs:
-            for i in range(len(traj.positions)):
-                # Draw a buffer circle around each waypoint
-                circle = Circle(
-                    (traj.positions[i][0], traj.positions[i][1]), buffer_m, color='yellow', fill=True, alpha=0.3)
-                ax.add_patch(circle)
+    if buffer_m is not None and sim_paths:
+        # Buffer circles around every waypoint, drawn as one collection
+        circles = EllipseCollection(
+            widths=2 * buffer_m, heights=2 * buffer_m, angles=0, units='xy',
+            offsets=sim_points, offset_transform=ax.transData,
+            facecolor='yellow', alpha=0.3)
+        ax.add_collection(circles)
+        ax.update_datalim(np.vstack([sim_points - buffer_m, sim_points + buffer_m]))
+        ax.autoscale_view()
 
     ax.set_xlabel('X (meters)')
     ax.set_ylabel('Y (meters)')
@@ -91,14 +122,14 @@ def plot_static_2d(primary_traj, sim_trajs, buffer_m: Optional[float] = None, sh
 
     # Save or show plot
     if save_path:
-        plt.savefig(save_path, dpi=300)
+        fig.savefig(save_path, dpi=dpi)
     if show:
         plt.show()
 
 # Animate 2D paths with conflicts
 
 
-def animate_2d(primary_traj, sim_trajs, conflicts: Optional[List[int]] = None, dt_display: float = 0.5, duration_clip: Optional[float] = None, save_path: Optional[str] = None) -> None:
+def animate_2d(primary_traj, sim_trajs, conflicts: Optional[List[int]] = None, dt_display: float = 0.5, duration_clip: Optional[float] = None, save_path: Optional[str] = None, writer: Union[str, MovieWriter] = 'ffmpeg', dpi: int = 300) -> None:
     """
     Create an animation that shows UAV paths over time with highlighted conflicts.
 
@@ -109,59 +140,66 @@ def animate_2d(primary_traj, sim_trajs, conflicts: Optional[List[int]] = None, d
         dt_display: Time step for the animation in seconds.
         duration_clip: Optional duration to clip the animation.
         save_path: Path to save the animation (MP4 format).
+        writer: Matplotlib movie writer name or instance used for saving
+            (e.g. 'pillow' for GIFs, or a stub writer in tests).
+        dpi: Resolution of the saved frames.
     """
     fig, ax = plt.subplots(figsize=(8, 8))
-    ax.set_xlim(np.min([pos[0] for pos in primary_traj.positions]) - 10,
-                np.max([pos[0] for pos in primary_traj.positions]) + 10)
-    ax.set_ylim(np.min([pos[1] for pos in primary_traj.positions]) - 10,
-                np.max([pos[1] for pos in primary_traj.positions]) + 10)
+    primary_pos = primary_traj.positions
+    # Full coordinate arrays, fetched once; update() only takes slices
+    px, py = primary_pos[:, 0], primary_pos[:, 1]
+    sim_xy = [(traj.positions[:, 0], traj.positions[:, 1]) for traj in sim_trajs]
+    mins = primary_pos.min(axis=0)
+    maxs = primary_pos.max(axis=0)
+    ax.set_xlim(mins[0] - 10, maxs[0] + 10)
+    ax.set_ylim(mins[1] - 10, maxs[1] + 10)
 
     # Plot the UAV trajectories as lines (will be updated in animation)
     line_primary, = ax.plot(
         [], [], label="Primary Mission", color='b', linewidth=2)
-    line_simulated, = ax.plot(
-        [], [], label="Simulated Flights", color='r', linestyle='--')
+    # One line per simulated flight
+    lines_simulated = [
+        ax.plot([], [], label=f"Simulated {traj.flight_id}",
+                color='r', linestyle='--')[0]
+        for traj in sim_trajs
+    ]
 
     # Plot waypoints (fixed)
-    ax.scatter([pos[0] for pos in primary_traj.positions], [pos[1]
-               for pos in primary_traj.positions], color='b', zorder=5)
-    for traj in sim_trajs:
-        ax.scatter([pos[0] for pos in traj.positions], [pos[1]
-                   for pos in traj.positions], color='r', zorder=5)
+    ax.scatter(px, py, color='b', zorder=5)
+    for xs, ys in sim_xy:
+        ax.scatter(xs, ys, color='r', zorder=5)
+
+    conflict_frames = set(conflicts or ())
 
     def update(frame):
         # Update positions for primary mission
-        line_primary.set_data([pos[0] for pos in primary_traj.positions[:frame]], [
-                              pos[1] for pos in primary_traj.positions[:frame]])
+        line_primary.set_data(px[:frame], py[:frame])
 
         # Update positions for simulated drones
-        for traj, line in zip(sim_trajs, [line_simulated]):
-            line.set_data([pos[0] for pos in traj.positions[:frame]], [
-                          pos[1] for pos in traj.positions[:frame]])
+        for (xs, ys), line in zip(sim_xy, lines_simulated):
+            line.set_data(xs[:frame], ys[:frame])
 
         # Highlight conflicts if any
-        if conflicts and frame in conflicts:
-            ax.scatter(
-                primary_traj.positions[frame][0], primary_traj.positions[frame][1], color='r', s=100)
-            for traj in sim_trajs:
-                ax.scatter(
-                    traj.positions[frame][0], traj.positions[frame][1], color='r', s=100)
+        if frame in conflict_frames:
+            ax.scatter(px[frame], py[frame], color='r', s=100)
+            for xs, ys in sim_xy:
+                ax.scatter(xs[frame], ys[frame], color='r', s=100)
 
-        return line_primary, line_simulated
+        return (line_primary, *lines_simulated)
 
     # Create animation
     ani = FuncAnimation(fig, update, frames=len(
-        primary_traj.positions), interval=dt_display * 1000, repeat=False)
+        primary_pos), interval=dt_display * 1000, repeat=False)
 
     # Save or display the animation
     if save_path:
-        ani.save(save_path, writer='ffmpeg', dpi=300)
+        ani.save(save_path, writer=writer, dpi=dpi)
     plt.show()
 
 # Interactive 3D plot for UAV trajectories
 
 
-def plot_interactive_3d(primary_traj, sim_trajs, conflict_events: Optional[List[int]] = None, save_html: Optional[str] = None) -> None:
+def plot_interactive_3d(primary_traj, sim_trajs, conflict_events: Optional[List[int]] = None, save_html: Optional[Union[str, IO[str]]] = None, show: bool = True) -> None:
     """
     Create an interactive 3D plot using Plotly to show UAV trajectories.
 
@@ -169,47 +207,48 @@ def plot_interactive_3d(primary_traj, sim_trajs, conflict_events: Optional[List[
         primary_traj: Trajectory of the primary drone.
         sim_trajs: List of Trajectories for simulated drones.
         conflict_events: List of conflicts to highlight.
-        save_html: Path to save the interactive 3D plot (HTML).
+        save_html: Path or text file-like to save the interactive 3D plot (HTML).
+        show: Whether to open the plot.
     """
     # Create traces for each UAV
+    primary_pos = primary_traj.positions
     trace_primary = go.Scatter3d(
-        x=[pos[0] for pos in primary_traj.positions],
-        y=[pos[1] for pos in primary_traj.positions],
-        z=[pos[2] for pos in primary_traj.positions],
+        x=primary_pos[:, 0],
+        y=primary_pos[:, 1],
+        z=primary_pos[:, 2],
         mode='lines+markers',
         name='Primary Mission',
         line=dict(color='blue', width=4),
         marker=dict(size=5, color='blue')
     )
 
+    # All simulated flights in one trace, separated by NaN rows
     traces_simulated = []
-    for traj in sim_trajs:
-        trace = go.Scatter3d(
-            x=[pos[0] for pos in traj.positions],
-            y=[pos[1] for pos in traj.positions],
-            z=[pos[2] for pos in traj.positions],
+    if sim_trajs:
+        gap = np.full((1, 3), np.nan)
+        sim_pos = np.vstack(
+            [np.vstack([traj.positions, gap]) for traj in sim_trajs])
+        flight_ids = np.concatenate(
+            [np.full(len(traj.positions) + 1, traj.flight_id, dtype=object)
+             for traj in sim_trajs])
+        traces_simulated.append(go.Scatter3d(
+            x=sim_pos[:, 0],
+            y=sim_pos[:, 1],
+            z=sim_pos[:, 2],
+            text=flight_ids,
             mode='lines+markers',
-            name=f'Simulated {traj.flight_id}',
+            name='Simulated Flights',
+            connectgaps=False,
             line=dict(color='red', width=2, dash='dash'),
             marker=dict(size=5, color='red')
-        )
-        traces_simulated.append(trace)
-
-    # Create the layout with a time slider
-    layout = go.Layout(
-        title='3D UAV Trajectories',
-        scene=dict(
-            xaxis_title='X',
-            yaxis_title='Y',
-            zaxis_title='Z',
-        ),
-    )
+        ))
 
     # Combine the traces
     data = [trace_primary] + traces_simulated
 
-    fig = go.Figure(data=data, layout=layout)
+    fig = go.Figure(data=data, layout=_LAYOUT_3D)
 
     if save_html:
         fig.write_html(save_html)
-    fig.show()
+    if show:
+        fig.show()
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from deconflict.analyzer import (
+    _prune_far_flights,
+    naive_conflict_score,
+    naive_conflict_scores,
+)
+from deconflict.models import Waypoint
+from deconflict.traject import interpolate_from_waypoints
+
+
+def test_naive_conflict_scores_vectorized() -> None:
+    """
+    Scores fall linearly from 1 at zero separation to 0 at the threshold,
+    and the scalar helper agrees with the array version.
+    """
+    distances = np.array([-5.0, 0.0, 12.5, 25.0, 50.0, 80.0])
+
+    scores = naive_conflict_scores(distances, threshold_m=50.0)
+
+    assert np.allclose(scores, [1.0, 1.0, 0.75, 0.5, 0.0, 0.0])
+    assert [naive_conflict_score(d, 50.0) for d in distances] == scores.tolist()
+
+
+def test_prune_far_flights_keeps_only_nearby_paths() -> None:
+    """
+    A crossing flight survives the pre-filter; a distant one and one that
+    never overlaps in time are dropped.
+    """
+    start = datetime(2025, 1, 1, 10, 0, 0)
+    end = start + timedelta(seconds=10)
+    primary = interpolate_from_waypoints(
+        [Waypoint(x=0.0, y=0.0, z=0.0), Waypoint(x=10.0, y=0.0, z=0.0)],
+        mission_window=(start, end),
+    )
+    crossing = interpolate_from_waypoints(
+        [Waypoint(x=5.0, y=-5.0, z=0.0), Waypoint(x=5.0, y=5.0, z=0.0)],
+        mission_window=(start, end),
+        flight_id="near",
+    )
+    distant = interpolate_from_waypoints(
+        [Waypoint(x=0.0, y=500.0, z=0.0), Waypoint(x=10.0, y=500.0, z=0.0)],
+        mission_window=(start, end),
+        flight_id="far",
+    )
+
+    later = interpolate_from_waypoints(
+        [Waypoint(x=5.0, y=-5.0, z=0.0), Waypoint(x=5.0, y=5.0, z=0.0)],
+        mission_window=(end + timedelta(seconds=1), end + timedelta(seconds=11)),
+        flight_id="later",
+    )
+
+    kept = _prune_far_flights(
+        primary, [crossing, distant, later], buffer_m=1.0, dt=1.0)
+
+    # "later" crosses the path but never overlaps in time
+    assert [t.flight_id for t in kept] == ["near"]
@@ -8,7 +8,7 @@ import pytest
 def run_cli():
     # Replace with the actual command to run the CLI
     command = [
-        "python", "src/cli.py",
+        "python", "-m", "deconflict.cli",
         "--primary", "data/sample_primary_mission.json",
         "--sim", "data/sample_simulated_flights.json",
         "--buffer", "50",
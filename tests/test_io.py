@@ -1,9 +1,17 @@
-from datetime import datetime
+import json
+import time
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
+import pytest
+
+import deconflict.io as dio
 from deconflict.io import (
     DATA_DIR,
     load_primary,
     load_simulated_flights,
+    parse_iso8601_many,
+    save_conflict_report,
 )
 from deconflict.models import PrimaryMission, SimulatedFlight, Waypoint
 
@@ -51,3 +59,105 @@ def test_load_simulated_flights_basic() -> None:
     assert isinstance(t0, datetime)
     assert isinstance(t1, datetime)
     assert t0 <= t1
+
+
+def _epochs(times) -> list:
+    return [t.timestamp() for t in times]
+
+
+@pytest.mark.parametrize("tz", ["UTC", "America/New_York", "Europe/Moscow"])
+def test_parse_iso8601_many_naive_matches_timestamp(monkeypatch, tz: str) -> None:
+    """
+    Naive timestamps convert like datetime.timestamp() in the local zone,
+    including across DST changes and historical offset changes (Moscow
+    was UTC+4 in 2012 and UTC+3 from late 2014).
+    """
+    if not hasattr(time, "tzset"):
+        pytest.skip("needs time.tzset")
+    monkeypatch.setenv("TZ", tz)
+    time.tzset()
+    try:
+        values = [
+            "2012-07-01T12:00:00",
+            "2016-07-01T12:00:00",
+            "2025-03-09T01:30:00",
+            "2025-03-09T03:30:00.250000",
+            "2025-11-20T09:00:00",
+        ]
+        times, epoch = parse_iso8601_many(values)
+
+        assert times == [datetime.fromisoformat(v) for v in values]
+        assert np.allclose(epoch, _epochs(times), rtol=0.0, atol=1e-6)
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_parse_iso8601_many_aware() -> None:
+    """
+    Z / offset suffixes keep their tzinfo and convert to the right instant.
+    """
+    times, epoch = parse_iso8601_many(
+        ["2025-11-20T09:00:00Z", "2025-11-20T09:00:00+05:30"])
+
+    assert times[0] == datetime(2025, 11, 20, 9, tzinfo=timezone.utc)
+    assert times[1].utcoffset() == timedelta(hours=5, minutes=30)
+    assert epoch.tolist() == [1763629200.0, 1763629200.0 - 5.5 * 3600]
+
+
+@pytest.mark.parametrize("bad", ["NaT", ""])
+def test_parse_iso8601_many_rejects_nat(bad: str) -> None:
+    """Strings NumPy reads as NaT raise like parse_iso8601 would."""
+    with pytest.raises(ValueError, match="Invalid ISO-8601"):
+        parse_iso8601_many([bad, "2025-01-01T00:00:00"])
+
+
+def test_reassigning_waypoints_refreshes_position_caches() -> None:
+    """
+    The loader fills the SoA caches; replacing the route must not leave
+    them stale.
+    """
+    mission = load_primary(DATA_DIR / "sample_primary_mission.json")
+    flight = load_simulated_flights(DATA_DIR / "sample_simulated_flights.json")[0]
+    new_route = [Waypoint(x=1.0, y=2.0, z=3.0, t=datetime(2025, 1, 1)),
+                 Waypoint(x=4.0, y=5.0, t=datetime(2025, 1, 1, 0, 1))]
+
+    mission.waypoints = new_route
+    flight.waypoints = new_route
+
+    for obj in (mission, flight):
+        assert obj.positions.tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 0.0]]
+    assert flight.ts_epoch.tolist() == [wp.t.timestamp() for wp in new_route]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_conflict_report_writes_non_finite_as_null(
+        monkeypatch, tmp_path, use_orjson: bool) -> None:
+    """orjson and the stdlib fallback write the same report."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(dio, "orjson", None)
+    report = {
+        "status": "conflict",
+        "conflicts": [{
+            "flight_id": "S1",
+            "t": datetime(2025, 1, 1, 10, 0, 0),
+            "distance_m": float("nan"),
+            "score": np.float64("-inf"),
+        }],
+        "waypoint": Waypoint(x=1.0, y=float("inf"), z=0.0),
+    }
+    path = tmp_path / "report.json"
+
+    save_conflict_report(report, path)
+
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved["conflicts"] == [{
+        "flight_id": "S1",
+        "t": "2025-01-01T10:00:00",
+        "distance_m": None,
+        "score": None,
+    }]
+    assert saved["waypoint"]["y"] is None
+    assert saved["waypoint"]["x"] == 1.0
@@ -0,0 +1,48 @@
+import numpy as np
+
+from deconflict._kernels import conflict_kernel, min_dist_idx
+
+
+def test_min_dist_idx_matches_numpy() -> None:
+    """
+    The fused kernel must agree with the norm/argmin reference.
+    """
+    rng = np.random.default_rng(0)
+    A = rng.uniform(-100.0, 100.0, size=(50, 2))
+    B = rng.uniform(-100.0, 100.0, size=(50, 2))
+
+    min_d, idx = min_dist_idx(A[:, 0], A[:, 1], B[:, 0], B[:, 1])
+
+    ref = np.linalg.norm(A - B, axis=1)
+    assert idx == int(np.argmin(ref))
+    assert abs(min_d - float(ref.min())) < 1e-9
+
+
+def test_conflict_kernel_matches_interp_reference() -> None:
+    """
+    The fused sample/threshold kernel must flag the same samples as
+    per-axis np.interp + norm.
+    """
+    rng = np.random.default_rng(1)
+    tp = np.cumsum(rng.uniform(1.0, 5.0, 20))
+    ts = np.cumsum(rng.uniform(1.0, 5.0, 25))
+    pp = rng.uniform(0.0, 200.0, (3, 20))
+    ps = rng.uniform(0.0, 200.0, (3, 25))
+    t_grid = np.arange(max(tp[0], ts[0]), min(tp[-1], ts[-1]), 0.5)
+
+    for use_3d in (False, True):
+        dims = 3 if use_3d else 2
+        ref = np.linalg.norm(
+            np.stack([np.interp(t_grid, ts, ps[k]) - np.interp(t_grid, tp, pp[k])
+                      for k in range(dims)], axis=1),
+            axis=1,
+        )
+        idx, d2 = conflict_kernel(tp, pp, ts, ps, t_grid, 60.0**2, use_3d)
+
+        assert idx.tolist() == np.flatnonzero(ref < 60.0).tolist()
+        assert np.allclose(np.sqrt(d2), ref[idx], atol=1e-9)
+
+    # Storage may be narrower, but the distance math stays float64
+    _, d2 = conflict_kernel(tp, pp.astype(np.float32), ts, ps.astype(np.float32),
+                            t_grid, 60.0**2, False)
+    assert d2.dtype == np.float64
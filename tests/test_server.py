@@ -0,0 +1,109 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from deconflict.server import SimulatedFlight, _sim_trajectories, app  # noqa: E402
+
+client = TestClient(app)
+
+
+def _request(flight_y: float, **overrides) -> dict:
+    """
+    Primary flies (0,0) -> (100,0) over 100 s; one simulated flight flies
+    the same track offset by flight_y metres over the same window.
+    """
+    body = {
+        "mission": {
+            "mission_id": "P1",
+            "start": "2025-01-01T10:00:00Z",
+            "end": "2025-01-01T10:01:40Z",
+            "waypoints": [{"x": 0.0, "y": 0.0}, {"x": 100.0, "y": 0.0}],
+        },
+        "flights": [
+            {
+                "flight_id": "S1",
+                "waypoints": [
+                    {"x": 0.0, "y": flight_y, "t": "2025-01-01T10:00:00Z"},
+                    {"x": 100.0, "y": flight_y, "t": "2025-01-01T10:01:40Z"},
+                ],
+            }
+        ],
+        "safety_buffer_m": 50.0,
+        "dt": 1.0,
+    }
+    body.update(overrides)
+    return body
+
+
+def test_check_clear() -> None:
+    response = client.post("/check", json=_request(flight_y=500.0))
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "clear"
+    assert response.json()["conflicts"] == []
+
+
+def test_check_conflict() -> None:
+    response = client.post("/check", json=_request(flight_y=10.0))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "conflict"
+    assert {c["flight_id"] for c in body["conflicts"]} == {"S1"}
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"dt": 0},
+        {"dt": 1e-7},
+        {"safety_buffer_m": -1.0},
+    ],
+)
+def test_check_rejects_invalid_parameters(overrides) -> None:
+    """A zero or tiny dt and a negative buffer are rejected up front."""
+    response = client.post("/check", json=_request(flight_y=10.0, **overrides))
+
+    assert response.status_code == 422
+
+
+def test_check_rejects_oversized_grid() -> None:
+    """A long window at a fine dt would allocate too many samples."""
+    body = _request(flight_y=10.0, dt=0.01)
+    body["mission"]["end"] = "2025-01-31T10:00:00Z"
+
+    response = client.post("/check", json=body)
+
+    assert response.status_code == 422
+    assert "samples" in response.json()["detail"]
+
+
+def test_check_rejects_untimed_flight() -> None:
+    body = _request(flight_y=10.0)
+    del body["flights"][0]["waypoints"][1]["t"]
+
+    response = client.post("/check", json=body)
+
+    assert response.status_code == 422
+
+
+def test_sim_trajectories_share_read_only_arrays() -> None:
+    """
+    Identical traffic reuses one cached build; each caller gets its own
+    flight_id and bracket cache over read-only arrays.
+    """
+    waypoints = _request(flight_y=10.0)["flights"][0]["waypoints"]
+    a, b = _sim_trajectories([
+        SimulatedFlight(flight_id="A", waypoints=waypoints),
+        SimulatedFlight(flight_id="B", waypoints=waypoints),
+    ])
+
+    assert a is not b
+    assert (a.flight_id, b.flight_id) == ("A", "B")
+    assert a.times is b.times
+    assert a._bracket_cache is not b._bracket_cache
+    for arr in (a.times, a.positions, *a.bbox):
+        assert not arr.flags.writeable
@@ -1,9 +1,16 @@
+import subprocess
+import sys
 from datetime import datetime, timedelta
 
+import numpy as np
+import pytest
+
+from deconflict._compat import HAS_NUMBA
+from deconflict._kernels import _CONFLICT_KERNELS
 from deconflict.models import Waypoint
 from deconflict.spatial import check_spatial_conflict
 from deconflict.temporal import check_spatiotemporal_conflicts
-from deconflict.traject import interpolate_from_waypoints
+from deconflict.traject import Trajectory, interpolate_from_waypoints
 
 
 def test_clear_temporal_overlap() -> None:
@@ -93,3 +100,135 @@ def test_conflict_report_format() -> None:
     # Check if the report contains the expected conflict explanation
     assert "explanation" in conflict_result["conflicts"][0]
     assert "min_distance_m" in conflict_result["conflicts"][0]
+
+
+def test_conflict_at_large_absolute_coordinates() -> None:
+    """
+    Sub-metre separations must survive absolute coordinates around 5e6 m.
+    """
+    start = datetime(2025, 1, 1, 10, 0, 0)
+    end = start + timedelta(seconds=10)
+    waypoints_A = [
+        Waypoint(x=5e6, y=0.0, z=0.0),
+        Waypoint(x=5e6, y=10.0, z=0.0),
+    ]
+    waypoints_B = [
+        Waypoint(x=5e6 + 0.9, y=0.0, z=0.0),
+        Waypoint(x=5e6 + 0.9, y=10.0, z=0.0),
+    ]
+
+    traj_A = interpolate_from_waypoints(
+        waypoints_A, mission_window=(start, end))
+    traj_B = interpolate_from_waypoints(
+        waypoints_B, mission_window=(start, end))
+
+    conflict_result = check_spatiotemporal_conflicts(
+        traj_A, [traj_B], safety_buffer_m=1.0, dt=1.0
+    )
+
+    assert conflict_result["status"] == "conflict"
+    assert abs(conflict_result["conflicts"][0]["min_distance_m"] - 0.9) < 1e-6
+
+
+def test_pooled_and_parallel_scans_in_one_process() -> None:
+    """
+    The thread-pool path (serial kernel, several flights) and the
+    single-flight path (prange kernel) must both run in the same process
+    and agree with each other.
+    """
+    if HAS_NUMBA:
+        for use_3d in (False, True):
+            assert (_CONFLICT_KERNELS[use_3d, True].py_func
+                    is not _CONFLICT_KERNELS[use_3d, False].py_func)
+
+    rng = np.random.default_rng(2)
+    times = np.linspace(0.0, 100.0, 11)
+    primary = Trajectory(times, rng.uniform(0.0, 50.0, (11, 3)))
+    sims = [
+        Trajectory(times, rng.uniform(0.0, 50.0, (11, 3)), flight_id=f"S{i}")
+        for i in range(3)
+    ]
+
+    for use_3d in (False, True):
+        pooled = check_spatiotemporal_conflicts(
+            primary, sims, safety_buffer_m=20.0, dt=0.5, use_3d=use_3d)
+        single = [
+            check_spatiotemporal_conflicts(
+                primary, [sim], safety_buffer_m=20.0, dt=0.5, use_3d=use_3d)
+            for sim in sims
+        ]
+        expected = [c for r in single for c in r["conflicts"]]
+
+        assert pooled["status"] == "conflict"
+        assert [(c["flight_id"], c["time_of_min"]) for c in pooled["conflicts"]] == [
+            (c["flight_id"], c["time_of_min"]) for c in expected]
+        assert np.allclose([c["min_distance_m"] for c in pooled["conflicts"]],
+                           [c["min_distance_m"] for c in expected])
+
+
+@pytest.mark.parametrize("buffer_m", [-1.0, float("nan"), float("inf")])
+def test_invalid_safety_buffer_rejected(buffer_m: float) -> None:
+    """
+    Negative or non-finite buffers are rejected instead of being squared
+    into a positive threshold.
+    """
+    times = np.array([0.0, 10.0])
+    primary = Trajectory(times, np.array([[0.0, 0.0, 0.0], [10.0, 0.0, 0.0]]))
+    sim = Trajectory(times, np.array([[0.0, 0.5, 0.0], [10.0, 0.5, 0.0]]), flight_id="S")
+
+    with pytest.raises(ValueError):
+        check_spatiotemporal_conflicts(primary, [sim], safety_buffer_m=buffer_m)
+
+
+@pytest.mark.parametrize("dt", [0.0, -1.0, float("nan"), float("inf")])
+def test_invalid_dt_rejected(dt: float) -> None:
+    """Zero, negative or non-finite steps are rejected up front."""
+    times = np.array([0.0, 10.0])
+    primary = Trajectory(times, np.array([[0.0, 0.0, 0.0], [10.0, 0.0, 0.0]]))
+    sim = Trajectory(times, np.array([[0.0, 0.5, 0.0], [10.0, 0.5, 0.0]]), flight_id="S")
+
+    with pytest.raises(ValueError, match="dt must be"):
+        check_spatiotemporal_conflicts(primary, [sim], safety_buffer_m=1.0, dt=dt)
+
+
+def test_overlap_window_between_grid_ticks() -> None:
+    """
+    A flight whose overlap window lies between two grid ticks must still be
+    sampled (at least at the start of its window).
+    """
+    t0 = 1_700_000_000.0
+    primary = Trajectory(
+        np.array([t0, t0 + 100.0]),
+        np.array([[10.0, 0.0, 0.0], [10.0, 1.0, 0.0]]),
+    )
+    sim = Trajectory(
+        np.array([t0 + 10.05, t0 + 10.95]),
+        np.array([[10.0, 0.0, 0.0], [10.0, 0.5, 0.0]]),
+        flight_id="S",
+    )
+
+    conflict_result = check_spatiotemporal_conflicts(
+        primary, [sim], safety_buffer_m=5.0, dt=1.0
+    )
+
+    assert conflict_result["status"] == "conflict"
+
+
+def test_single_flight_scan_off_main_thread_exits_cleanly() -> None:
+    """
+    Checking one flight from a worker thread (as the server does) must not
+    leave the interpreter hanging at exit.
+    """
+    code = (
+        "import threading\n"
+        "import numpy as np\n"
+        "from deconflict.temporal import check_spatiotemporal_conflicts\n"
+        "from deconflict.traject import Trajectory\n"
+        "t = np.array([0.0, 10.0])\n"
+        "a = Trajectory(t, np.zeros((2, 3)))\n"
+        "b = Trajectory(t, np.ones((2, 3)), flight_id='S')\n"
+        "th = threading.Thread(target=check_spatiotemporal_conflicts, args=(a, [b], 5.0))\n"
+        "th.start()\n"
+        "th.join()\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, timeout=120)
@@ -1,10 +1,12 @@
+import time
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
 import numpy as np
 import pytest
 
 from deconflict.models import Waypoint
-from deconflict.traject import Trajectory, interpolate_from_waypoints
+from deconflict.traject import Trajectory, _to_epoch, interpolate_from_waypoints
 
 
 def test_linear_midpoint_primary_mission() -> None:
@@ -96,3 +98,107 @@ def test_sample_uniform_grid() -> None:
 
     xs = positions_out[:, 0]
     assert np.allclose(xs, np.array([0.0, 1.0, 2.0, 3.0, 4.0]))
+
+
+def test_sample_positions_at_matches_scalar() -> None:
+    """
+    Vectorized sampling must agree with the scalar sampler, including clamping.
+    """
+    start = datetime(2025, 1, 1, 10, 0, 0)
+    end = start + timedelta(seconds=10)
+
+    waypoints = [
+        Waypoint(x=0.0, y=0.0, z=0.0),
+        Waypoint(x=10.0, y=0.0, z=0.0),
+        Waypoint(x=10.0, y=10.0, z=5.0),
+    ]
+
+    traj = interpolate_from_waypoints(waypoints, mission_window=(start, end))
+
+    t0, t1 = traj.time_range()
+    ts = np.linspace(t0 - 2.0, t1 + 2.0, 17)
+
+    positions = traj.sample_positions_at(ts)
+
+    assert positions.shape == (17, 3)
+    expected = np.array([traj.sample_position_at(float(t)) for t in ts])
+    assert np.allclose(positions, expected)
+
+
+def test_sample_positions_at_bracket_cache() -> None:
+    """
+    Sampling through a cached grid key must match an uncached sample,
+    including on the second (cache-hit) call.
+    """
+    traj = Trajectory(
+        times=np.array([0.0, 4.0, 10.0]),
+        positions=np.array([[0.0, 0.0, 0.0], [4.0, 0.0, 0.0], [4.0, 6.0, 3.0]]),
+    )
+    ts = np.arange(0.0, 10.0, 0.5)
+
+    expected = traj.sample_positions_at(ts)
+    for _ in range(2):
+        assert np.array_equal(traj.sample_positions_at(ts, cache_key="grid"), expected)
+
+
+def test_interpolate_from_waypoints_is_cached_and_read_only() -> None:
+    """
+    Identical waypoint inputs share cached read-only arrays, while each call
+    gets its own Trajectory object.
+    """
+    start = datetime(2025, 1, 1, 12, 0, 0)
+    wps = [Waypoint(x=0.0, y=0.0), Waypoint(x=100.0, y=0.0)]
+    window = (start, start + timedelta(seconds=100))
+
+    first = interpolate_from_waypoints(wps, mission_window=window)
+    second = interpolate_from_waypoints(list(wps), mission_window=window,
+                                        flight_id="other")
+
+    # Arrays are shared and read-only; per-caller state is not
+    assert first.times is second.times
+    assert not first.times.flags.writeable
+    assert not first.positions.flags.writeable
+    with pytest.raises(ValueError):
+        first.positions[0, 0] = 1.0
+    # bbox drives the temporal cull, so it is frozen too
+    with pytest.raises(ValueError):
+        first.bbox[0][0] = -1e9
+    with pytest.raises(ValueError):
+        first.bbox[1][0] = 1e9
+
+    assert (first.flight_id, second.flight_id) == ("primary", "other")
+    first.flight_id = "renamed"
+    first.sample_positions_at(np.array([start.timestamp()]), cache_key="grid")
+    third = interpolate_from_waypoints(wps, mission_window=window)
+    assert third.flight_id == "primary"
+    assert third._bracket_cache == {} and second._bracket_cache == {}
+
+    # Equal-but-different-fold windows must not share a cache entry
+    shifted = interpolate_from_waypoints(
+        wps, mission_window=(start.replace(fold=1), window[1].replace(fold=1)))
+    assert shifted.times is not first.times
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+def test_to_epoch_respects_fold_and_timezone(monkeypatch) -> None:
+    """
+    Ambiguous local times convert according to fold, for naive and aware
+    datetimes, and naive conversions follow the current process timezone.
+    """
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        naive = datetime(2025, 11, 2, 1, 30)
+        assert _to_epoch(naive) == 1762061400.0
+        assert _to_epoch(naive.replace(fold=1)) == 1762065000.0
+
+        aware = naive.replace(tzinfo=ZoneInfo("America/New_York"))
+        assert _to_epoch(aware) == 1762061400.0
+        assert _to_epoch(aware.replace(fold=1)) == 1762065000.0
+
+        monkeypatch.setenv("TZ", "UTC")
+        time.tzset()
+        assert _to_epoch(naive) == 1762047000.0
+    finally:
+        monkeypatch.undo()
+        time.tzset()
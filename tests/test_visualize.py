@@ -1,15 +1,36 @@
-from deconflict.visualize import plot_interactive_3d
+import io
 import os
 import tempfile
 
-import pytest
+import matplotlib
 
-from deconflict.models import PrimaryMission, SimulatedFlight, Waypoint
-from deconflict.visualize import animate_2d, plot_interactive_3d, plot_static_2d
+# Select the headless backend before pyplot is imported (by visualize)
+matplotlib.use("Agg")
+
+import pytest  # noqa: E402
+from matplotlib.animation import AbstractMovieWriter, writers  # noqa: E402
+
+from deconflict.models import PrimaryMission, SimulatedFlight, Waypoint  # noqa: E402
+from deconflict.visualize import animate_2d, plot_interactive_3d, plot_static_2d  # noqa: E402
+
+
+class NullWriter(AbstractMovieWriter):
+    """Movie writer that only touches the output file and counts frames."""
+
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi)
+        self.frames = 0
+        open(outfile, "wb").close()
+
+    def grab_frame(self, **savefig_kwargs):
+        self.frames += 1
+
+    def finish(self):
+        pass
 
 
 # Sample data for testing
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data():
     # Create primary mission
     mission = PrimaryMission(
@@ -38,31 +59,61 @@ def sample_data():
 
 
 def test_plot_static_2d(sample_data):
+    mission, flights = sample_data
+    buf = io.BytesIO()
+    plot_static_2d(mission, flights, save_path=buf, show=False, dpi=72)
+
+    assert buf.getbuffer().nbytes > 0
+
+
+@pytest.mark.integration
+def test_plot_static_2d_to_disk(sample_data):
     mission, flights = sample_data
     # Create a temp file that actually ends in .png
     with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp_file:
-        plot_static_2d(mission, flights, save_path=temp_file.name)
+        plot_static_2d(mission, flights, save_path=temp_file.name, dpi=72)
 
         # Now this is true by construction
         assert temp_file.name.endswith(".png")
         # And we actually check that the file was written
-        assert os.path.exists(temp_file.name)
+        assert os.path.getsize(temp_file.name) > 0
 
 
 def test_animate_2d(sample_data):
+    mission, flights = sample_data
+    writer = NullWriter()
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as temp_file:
+        animate_2d(mission, flights, save_path=temp_file.name, writer=writer)
+
+        assert os.path.exists(temp_file.name)
+        assert writer.frames == len(mission.waypoints)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not writers.is_available("ffmpeg"), reason="ffmpeg not installed")
+def test_animate_2d_ffmpeg(sample_data):
     mission, flights = sample_data
     # Give ffmpeg a proper .mp4 path
     with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as temp_file:
         animate_2d(mission, flights, save_path=temp_file.name)
 
         assert temp_file.name.endswith(".mp4")
-        assert os.path.exists(temp_file.name)
+        assert os.path.getsize(temp_file.name) > 0
 
 
 def test_plot_interactive_3d(sample_data):
+    mission, flights = sample_data
+    buf = io.StringIO()
+    plot_interactive_3d(mission, flights, save_html=buf, show=False)
+
+    assert "<html>" in buf.getvalue()
+
+
+@pytest.mark.integration
+def test_plot_interactive_3d_to_disk(sample_data):
     mission, flights = sample_data
     with tempfile.NamedTemporaryFile(suffix=".html", delete=False) as temp_file:
-        plot_interactive_3d(mission, flights, save_html=temp_file.name)
+        plot_interactive_3d(mission, flights, save_html=temp_file.name, show=False)
 
         assert temp_file.name.endswith(".html")
-        assert os.path.exists(temp_file.name)
+        assert os.path.getsize(temp_file.name) > 0